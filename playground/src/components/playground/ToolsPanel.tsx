@@ -25,7 +25,7 @@ export function ToolsPanel({
 
   const { listTools } = useAgentRpc(room, agentIdentity);
 
-  const handleRefresh = useCallback(async () => {
+  const fetchTools = useCallback(async (refresh: boolean) => {
     if (!room || !agentIdentity) {
       setError("Not connected to agent");
       return;
@@ -35,7 +35,7 @@ export function ToolsPanel({
     setError(null);
 
     try {
-      const response = await listTools();
+      const response = await listTools(refresh);
       if (response.success && response.tools) {
         setTools(response.tools);
       } else {
@@ -51,12 +51,15 @@ export function ToolsPanel({
     }
   }, [room, agentIdentity, listTools]);
 
+  // The button forces a re-fetch from the MCP servers; auto-fetch uses the cache
+  const handleRefresh = useCallback(() => fetchTools(true), [fetchTools]);
+
   // Auto-fetch tools when room and agent become available
   useEffect(() => {
     if (room && agentIdentity && !hasFetched) {
-      handleRefresh();
+      fetchTools(false);
     }
-  }, [room, agentIdentity, hasFetched, handleRefresh]);
+  }, [room, agentIdentity, hasFetched, fetchTools]);
 
   return (
     <ConfigurationPanelItem
@@ -68,7 +68,7 @@ export interface UseAgentRpcReturn {
   listModels: () => Promise<ListModelsResponse>;
   switchModel: (model: string) => Promise<SwitchModelResponse>;
   interrupt: () => Promise<InterruptResponse>;
-  listTools: () => Promise<ListToolsResponse>;
+  listTools: (refresh?: boolean) => Promise<ListToolsResponse>;
   getAgentState: () => Promise<AgentStateResponse>;
 
   // Utility
@@ -165,8 +165,8 @@ export function useAgentRpc(
    * List available tools from the agent's MCP servers
    * Returns tool information including name, description, and source server
    */
-  const listTools = useCallback(async (): Promise<ListToolsResponse> => {
-    return performRpcCall<ListToolsResponse>("list_tools");
+  const listTools = useCallback(async (refresh = false): Promise<ListToolsResponse> => {
+    return performRpcCall<ListToolsResponse>("list_tools", refresh ? { refresh } : undefined);
   }, [performRpcCall]);
 
   /**
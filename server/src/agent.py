@@ -3,9 +3,16 @@
 import logging
 import asyncio
 import os
-import json
-from livekit.agents import JobContext, WorkerOptions, cli
-from livekit.agents.voice import Agent, AgentSession, AgentStateChangedEvent, UserStateChangedEvent
+import orjson
+from livekit.agents import JobContext, JobProcess, WorkerOptions, cli
+from livekit.agents.voice import (
+    Agent,
+    AgentSession,
+    AgentStateChangedEvent,
+    FunctionToolsExecutedEvent,
+    UserInputTranscribedEvent,
+    UserStateChangedEvent,
+)
 from livekit.agents.voice.agent_session import SessionConnectOptions
 from livekit.agents.types import APIConnectOptions
 
@@ -14,6 +21,7 @@ from .rpc_handlers import AgentRpcHandlers
 from .telemetry import TelemetryEmitter
 from .wake_word import WakeWordGatedSession
 from .mcp_manager import MCPServerManager
+from .stt_whisper import resolve_model
 from .voice_pipeline import (
     create_stt,
     create_vad,
@@ -21,27 +29,52 @@ from .voice_pipeline import (
     create_tts,
     create_llm,
     create_wake_word_detector,
+    warm_llm,
+    warm_tts,
 )
 
 logger = logging.getLogger("alexa-os")
 
-# System prompt for the assistant
-SYSTEM_PROMPT = """You are Jarvis, a helpful voice assistant.
 
-Key behaviors:
-- Keep responses concise and conversational - this is voice, not text
-- Be friendly and natural in tone
-- When you don't know something, say so directly
-- For complex questions, break down the answer into digestible parts
-- Use simple language, avoid jargon unless asked
+def _wake_word_payload(state: str, model_name: str = "", confidence: float = 0.0) -> bytes:
+    """Encode a wake_word_state data message."""
+    return orjson.dumps({
+        "type": "wake_word_state",
+        "state": state,
+        "model": model_name,
+        "confidence": float(confidence),
+    })
+
+
+# Wake word states published on the reliable (ordered, retransmitted) data channel
+_RELIABLE_WAKE_WORD_STATES = frozenset({"detected", "active"})
+
+# Payloads sent on every utterance without model/confidence, encoded once
+_STATIC_WAKE_WORD_PAYLOADS = {
+    state: _wake_word_payload(state) for state in ("listening", "timeout")
+}
+
 
-You can help with:
-- Answering questions on any topic
-- Having casual conversations
-- Providing information and explanations
-- Helping with tasks and planning
+def setup_event_loop():
+    """Use uvloop's libuv-based event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return False
 
-Remember: You're speaking, not writing. Keep it brief and natural."""
+    uvloop.install()
+    return True
+
+
+def prewarm(proc: JobProcess):
+    """
+    Per-job-process setup, run before the process creates its event loop.
+
+    Jobs run in their own processes, which don't inherit the loop policy
+    installed in the worker - install uvloop here so entrypoint() runs on it.
+    """
+    if setup_event_loop():
+        logger.info("Job process event loop: uvloop")
 
 
 async def entrypoint(ctx: JobContext):
@@ -51,50 +84,73 @@ async def entrypoint(ctx: JobContext):
     logger.info(f"Room: {ctx.room.name}")
     logger.info("=" * 60)
 
+    # Load the LLM in the background so the first turn skips the model load
+    llm_warmup_task = asyncio.create_task(warm_llm())
+
+    # Warm up Whisper in the background so the first utterance skips model load
+    whisper_stt = create_stt()
+    # WHISPER_MODEL may be "auto" - report the model actually loaded
+    stt_model = resolve_model(settings.whisper_model, settings.whisper_device)
+    stt_warmup_task = asyncio.create_task(asyncio.to_thread(whisper_stt.warmup))
+
     await ctx.connect()
 
-    # Initialize handlers and telemetry
-    rpc_handlers = AgentRpcHandlers(room=ctx.room, ollama_host=settings.ollama_host)
+    # Initialize handlers and telemetry (handlers read agent_config.json - keep it off the loop)
+    rpc_handlers = await asyncio.to_thread(
+        AgentRpcHandlers, room=ctx.room, ollama_host=settings.ollama_host
+    )
+    # Config writes are debounced - don't lose the last one on shutdown
+    ctx.add_shutdown_callback(rpc_handlers.flush_now)
     telemetry = TelemetryEmitter(room=ctx.room)
+    telemetry.start()
+    ctx.add_shutdown_callback(telemetry.stop)
 
     # Load persisted VAD settings (for startup)
-    persisted_vad = rpc_handlers._load_vad_settings()
+    persisted_vad = await asyncio.to_thread(rpc_handlers._load_vad_settings)
     if persisted_vad:
         logger.info(f"Using persisted VAD settings: {persisted_vad}")
 
-    # Create voice pipeline components
+    # Create voice pipeline components concurrently - startup is bounded by
+    # the slowest loader (model files, MCP handshakes) rather than their sum
     logger.info("Initializing voice pipeline components...")
-    whisper_stt = create_stt()
-    vad = create_vad(vad_settings=persisted_vad)
+    mcp_manager = MCPServerManager(rpc_handlers)
+    ctx.add_shutdown_callback(mcp_manager.aclose)
+    vad, tts, llm, wake_word_detector, _ = await asyncio.gather(
+        asyncio.to_thread(create_vad, persisted_vad),
+        asyncio.to_thread(create_tts),
+        asyncio.to_thread(create_llm),
+        asyncio.to_thread(create_wake_word_detector),
+        mcp_manager.load_from_config(),
+    )
     streaming_stt = create_streaming_stt(whisper_stt, vad)
-    tts = create_tts()
-    llm = create_llm()
 
-    # MCP Server Manager
-    mcp_manager = MCPServerManager(rpc_handlers)
-    await mcp_manager.load_from_config()
+    # Open the HTTP connection to Ollama now rather than on the first turn
+    if hasattr(llm, "prewarm"):
+        llm.prewarm()
+    tts_warmup_task = asyncio.create_task(warm_tts(tts))
     mcp_servers = mcp_manager.servers
-
-    # Wake Word Detector
-    wake_word_detector = create_wake_word_detector()
     wake_word_gated_session = None
 
     # Wake word state helper
     async def send_wake_word_state(state: str, model_name: str = "", confidence: float = 0.0):
         try:
-            data = json.dumps({
-                "type": "wake_word_state",
-                "state": state,
-                "model": model_name,
-                "confidence": confidence,
-            }).encode("utf-8")
-            await ctx.room.local_participant.publish_data(data, reliable=True, topic="wake_word")
+            data = None
+            if not model_name and not confidence:
+                data = _STATIC_WAKE_WORD_PAYLOADS.get(state)
+            if data is None:
+                data = _wake_word_payload(state, model_name, confidence)
+            # Only activation needs guaranteed delivery; idle pings are superseded
+            # by the next one (and the UI can poll get_wake_word_state)
+            reliable = state in _RELIABLE_WAKE_WORD_STATES
+            await ctx.room.local_participant.publish_data(
+                data, reliable=reliable, topic="wake_word"
+            )
         except Exception as e:
             logger.error(f"Failed to publish wake word state: {e}")
 
     # Configure RPC handlers
     rpc_handlers.set_model(settings.ollama_model)
-    rpc_handlers.set_stt_model(settings.whisper_model)
+    rpc_handlers.set_stt_model(stt_model)
     rpc_handlers.set_tts_provider(f"{settings.tts_provider} ({settings.kokoro_voice})")
     # Use persisted VAD settings if available, otherwise use defaults
     vad_settings_for_rpc = persisted_vad or {
@@ -127,10 +183,11 @@ async def entrypoint(ctx: JobContext):
     rpc_handlers.set_model_change_callback(on_model_change)
     rpc_handlers.set_interrupt_callback(on_interrupt)
     rpc_handlers.set_mcp_change_callback(on_mcp_change)
+    rpc_handlers.set_tools_refresh_callback(mcp_manager.refresh_tools)
     await rpc_handlers.register_all()
 
     logger.info("Voice pipeline components:")
-    logger.info(f"  STT: Local Whisper ({settings.whisper_model})")
+    logger.info(f"  STT: Local Whisper ({stt_model})")
     logger.info(f"  VAD: Silero")
     logger.info(f"  TTS: Kokoro ({settings.kokoro_voice})")
     logger.info(f"  LLM: Ollama ({settings.ollama_model})")
@@ -157,15 +214,15 @@ async def entrypoint(ctx: JobContext):
         logger.info(f"Agent state: {event.old_state} -> {state}")
 
         if state == "thinking":
-            asyncio.create_task(telemetry.agent_state_change("thinking"))
+            telemetry.submit_state_change("thinking")
         elif state == "speaking":
-            asyncio.create_task(telemetry.agent_state_change("speaking"))
+            telemetry.submit_state_change("speaking")
             if wake_word_gated_session and wake_word_gated_session.is_active:
                 wake_word_gated_session.refresh_activity()
         elif state == "listening":
-            asyncio.create_task(telemetry.agent_state_change("listening"))
+            telemetry.submit_state_change("listening")
         elif state == "initializing":
-            asyncio.create_task(telemetry.agent_state_change("initializing"))
+            telemetry.submit_state_change("initializing")
 
     @session.on("user_state_changed")
     def on_user_state_changed(event: UserStateChangedEvent):
@@ -173,41 +230,41 @@ async def entrypoint(ctx: JobContext):
         logger.info(f"User state: {event.old_state} -> {state}")
 
         if state == "speaking":
-            asyncio.create_task(telemetry.agent_state_change("user_speaking"))
+            telemetry.submit_state_change("user_speaking")
             if wake_word_gated_session and wake_word_gated_session.is_active:
                 wake_word_gated_session.refresh_activity()
         elif state == "listening":
-            asyncio.create_task(telemetry.agent_state_change("user_stopped_speaking"))
+            telemetry.submit_state_change("user_stopped_speaking")
         elif state == "away":
-            asyncio.create_task(telemetry.agent_state_change("user_away"))
+            telemetry.submit_state_change("user_away")
 
     @session.on("user_input_transcribed")
-    def on_user_input_transcribed(event):
-        if hasattr(event, 'transcript') and event.transcript:
-            asyncio.create_task(telemetry.stt_result(event.transcript, is_final=True))
-            asyncio.create_task(telemetry.agent_state_change("transcribing"))
+    def on_user_input_transcribed(event: UserInputTranscribedEvent):
+        if event.transcript:
+            telemetry.submit(telemetry.stt_result(event.transcript, is_final=event.is_final))
+            telemetry.submit_state_change("transcribing")
 
     @session.on("function_tools_executed")
-    def on_function_tools_executed(event):
+    def on_function_tools_executed(event: FunctionToolsExecutedEvent):
         """Emit tool call telemetry when MCP tools complete."""
         async def emit_tool_telemetry():
             for call, output in event.zipped():
-                tool_name = getattr(call, 'name', str(call))
-                arguments = getattr(call, 'arguments', {})
-                result = getattr(output, 'content', str(output))
-                error = getattr(output, 'error', None) if hasattr(output, 'error') else None
+                result = output.output if output is not None else None
+                error = result if output is not None and output.is_error else None
 
-                request_id = await telemetry.tool_call_start(tool_name, arguments)
+                request_id = await telemetry.tool_call_start(call.name, call.arguments)
                 await telemetry.tool_call_end(request_id, result, error)
 
-                logger.info(f"Tool executed: {tool_name}")
+                logger.info(f"Tool executed: {call.name}")
 
-        asyncio.create_task(emit_tool_telemetry())
+        telemetry.submit(emit_tool_telemetry())
 
     # Use persisted system prompt
     system_prompt = rpc_handlers.get_system_prompt()
     logger.info(f"Using system prompt (length: {len(system_prompt)} chars)")
 
+    await asyncio.gather(stt_warmup_task, tts_warmup_task)
+
     await session.start(
         room=ctx.room,
         agent=Agent(instructions=system_prompt, llm=llm),
@@ -248,6 +305,8 @@ async def entrypoint(ctx: JobContext):
         await send_wake_word_state("listening")
         logger.info(f"Wake word active: Say '{settings.wake_word_model.replace('_', ' ')}'")
 
+    await llm_warmup_task
+
     logger.info("=" * 60)
     logger.info("Agent ready - listening for voice input...")
     logger.info("=" * 60)
@@ -266,6 +325,7 @@ def run_agent():
     cli.run_app(
         WorkerOptions(
             entrypoint_fnc=entrypoint,
+            prewarm_fnc=prewarm,
             api_key=settings.livekit_api_key,
             api_secret=settings.livekit_api_secret,
             ws_url=settings.livekit_url,
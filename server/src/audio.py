@@ -0,0 +1,31 @@
+"""PCM sample conversion shared by the local STT backends."""
+
+from typing import Optional
+
+import numpy as np
+
+# 1 / 32768: maps int16 full scale onto [-1.0, 1.0)
+INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def pcm16_to_float32(data, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert 16-bit PCM to float32 samples in [-1.0, 1.0).
+
+    Accepts bytes or any int16 buffer (e.g. AudioFrame.data, a memoryview).
+    The int16 samples are viewed in place and scaled in one pass straight
+    into the float32 output, so only a single array is allocated.
+    Float arrays are assumed to be normalized already unless they exceed 1.0.
+
+    If `out` (a float32 scratch array) is large enough, the int16 result is
+    written into its leading slice and that view is returned instead of
+    allocating a new array.
+    """
+    if isinstance(data, np.ndarray) and data.dtype.kind == "f":
+        audio = data.astype(np.float32, copy=False)
+        return audio * INT16_SCALE if audio.size and audio.max() > 1.0 else audio
+
+    samples = np.frombuffer(data, dtype=np.int16)
+    if out is not None and out.size >= samples.size:
+        return np.multiply(samples, INT16_SCALE, out=out[:samples.size])
+    return np.multiply(samples, INT16_SCALE, dtype=np.float32)
@@ -1,5 +1,6 @@
 """Configuration for Alexa-OS Voice Assistant."""
 
+import functools
 import os
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -17,14 +18,30 @@ class Settings(BaseSettings):
     llm_provider: str = Field(default="ollama", alias="LLM_PROVIDER")  # "ollama" or "anthropic"
     ollama_host: str = Field(default="http://localhost:11434", alias="OLLAMA_HOST")
     ollama_model: str = Field(default="llama3.2", alias="OLLAMA_MODEL")
+    # Cap on tokens per reply, sent as max_tokens - 0 leaves the model's default
+    ollama_num_predict: int = Field(default=0, alias="OLLAMA_NUM_PREDICT")
     anthropic_api_key: str | None = Field(default=None, alias="ANTHROPIC_API_KEY")
     anthropic_model: str = Field(default="claude-sonnet-4-20250514", alias="ANTHROPIC_MODEL")
 
     # STT Configuration - Local Whisper by default
     stt_provider: str = Field(default="whisper", alias="STT_PROVIDER")  # "whisper" only for now
-    whisper_model: str = Field(default="large-v3-turbo", alias="WHISPER_MODEL")
+    stt_backend: str = Field(default="ctranslate2", alias="STT_BACKEND")  # "ctranslate2" or "onnx"
+    # "auto" = distil-small.en on CPU, distil-large-v3 on CUDA
+    whisper_model: str = Field(default="auto", alias="WHISPER_MODEL")
     whisper_device: str = Field(default="auto", alias="WHISPER_DEVICE")  # auto, cpu, cuda, mps
+    # "auto" resolves to a quantized type: int8_float16 on CUDA, int8 on CPU
     whisper_compute_type: str = Field(default="auto", alias="WHISPER_COMPUTE_TYPE")
+    whisper_cpu_threads: int = Field(default=0, alias="WHISPER_CPU_THREADS")  # 0 = inference_threads()
+    whisper_num_workers: int = Field(default=1, alias="WHISPER_NUM_WORKERS")
+    # 1 = greedy decoding; short voice commands rarely gain from a wider beam
+    whisper_beam_size: int = Field(default=1, alias="WHISPER_BEAM_SIZE")
+    # Directory with encoder/decoder/decoder_with_past ONNX graphs (stt_backend="onnx")
+    # Defaults to <model_cache_dir>/whisper-onnx/<whisper_model>
+    whisper_onnx_dir: str | None = Field(default=None, alias="WHISPER_ONNX_DIR")
+    whisper_onnx_static_shapes: bool = Field(default=True, alias="WHISPER_ONNX_STATIC_SHAPES")
+    # Transcribe in rolling windows while the user speaks (0 = whole utterance via StreamAdapter)
+    stt_chunk_seconds: float = Field(default=0.0, alias="STT_CHUNK_SECONDS")
+    stt_chunk_overlap_seconds: float = Field(default=0.5, alias="STT_CHUNK_OVERLAP_SECONDS")
     whisper_language: str = Field(default="en", alias="WHISPER_LANGUAGE")
 
     # TTS Configuration - Kokoro via FastAPI
@@ -32,6 +49,8 @@ class Settings(BaseSettings):
     kokoro_url: str = Field(default="http://localhost:8880", alias="KOKORO_URL")
     kokoro_voice: str = Field(default="af_bella", alias="KOKORO_VOICE")
     kokoro_speed: float = Field(default=1.0, alias="KOKORO_SPEED")
+    # Raw 24kHz PCM skips mp3 encode (server) and decode (agent) on every chunk
+    kokoro_response_format: str = Field(default="pcm", alias="KOKORO_RESPONSE_FORMAT")
 
     # VAD Configuration
     # activation_threshold: 0.6 recommended for noisy environments (default Silero is 0.5)
@@ -45,6 +64,8 @@ class Settings(BaseSettings):
 
     # OpenMemory MCP
     openmemory_url: str | None = Field(default=None, alias="OPENMEMORY_URL")
+    # Seconds a cached tools/list response stays fresh on disk (0 disables)
+    mcp_tools_cache_ttl: float = Field(default=60.0, alias="MCP_TOOLS_CACHE_TTL")
 
     # Wake Word Detection - openWakeWord for "Hey Jarvis"
     wake_word_enabled: bool = Field(default=True, alias="WAKE_WORD_ENABLED")
@@ -52,6 +73,8 @@ class Settings(BaseSettings):
     wake_word_threshold: float = Field(default=0.5, alias="WAKE_WORD_THRESHOLD")
     wake_word_cooldown: float = Field(default=2.0, alias="WAKE_WORD_COOLDOWN")
     wake_word_timeout: float = Field(default=10.0, alias="WAKE_WORD_TIMEOUT")
+    # Run the wake word and embedding models from INT8-quantized ONNX copies
+    wake_word_int8: bool = Field(default=False, alias="WAKE_WORD_INT8")
 
     # Model download directory (defaults to ~/.cache/alexa-os for local dev)
     model_cache_dir: str = Field(
@@ -65,5 +88,40 @@ class Settings(BaseSettings):
         extra = "ignore"
 
 
+# Cores kept free for the asyncio loop and LiveKit's worker threads
+RESERVED_CORES = 2
+
+
+def inference_threads() -> int:
+    """
+    Thread count for CPU model inference (CTranslate2, ONNX Runtime).
+
+    Honors OMP_NUM_THREADS when set; otherwise uses physical cores minus
+    RESERVED_CORES so inference pools don't oversubscribe the event loop.
+    """
+    env_threads = os.environ.get("OMP_NUM_THREADS")
+    if env_threads and env_threads.isdigit() and int(env_threads) > 0:
+        return int(env_threads)
+
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        cores = None
+    cores = cores or os.cpu_count() or 1
+    return max(1, cores - RESERVED_CORES)
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings, parsing env/.env only once.
+
+    Callers that load extra environment (e.g. main.py's load_dotenv) must do
+    so before the first call.
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -2,17 +2,38 @@
 """Alexa-OS Voice Assistant Server - Entry Point."""
 
 import logging
+import os
 import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Load environment variables from project root
+# Load environment variables from project root before anything reads settings
 project_root = Path(__file__).parent.parent.parent
 load_dotenv(project_root / ".env")
 
-from .agent import run_agent
-from .config import settings
+from .config import get_settings, inference_threads
+
+
+def setup_threads():
+    """
+    Cap OpenMP/MKL pools before any inference library is imported.
+
+    Called at import time, ahead of the .agent import (which loads numpy,
+    CTranslate2 and ONNX Runtime). Job processes inherit the environment, so
+    their inference threads also stay off the cores reserved for the event loop.
+    """
+    threads = str(inference_threads())
+    os.environ.setdefault("OMP_NUM_THREADS", threads)
+    os.environ.setdefault("MKL_NUM_THREADS", threads)
+    return int(os.environ["OMP_NUM_THREADS"])
+
+
+inference_thread_count = setup_threads()
+
+from .agent import run_agent, setup_event_loop
+
+settings = get_settings()
 
 
 def setup_logging():
@@ -34,6 +55,7 @@ def main():
     """Main entry point."""
     setup_logging()
     logger = logging.getLogger("alexa-os")
+    uvloop_enabled = setup_event_loop()
 
     logger.info("=" * 60)
     logger.info("Alexa-OS Voice Assistant Server")
@@ -42,6 +64,9 @@ def main():
     logger.info(f"LLM Provider: {settings.llm_provider}")
     logger.info(f"STT Provider: {settings.stt_provider}")
     logger.info(f"TTS Provider: {settings.tts_provider}")
+    # Job processes install the same loop policy in their prewarm hook
+    logger.info(f"Event loop: {'uvloop' if uvloop_enabled else 'asyncio'} (worker and job processes)")
+    logger.info(f"Inference threads: {inference_thread_count}")
     logger.info("=" * 60)
 
     # Run the agent
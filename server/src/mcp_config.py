@@ -1,17 +1,23 @@
 """MCP server configuration store for dynamic management."""
 
-import json
 import logging
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Literal, Optional
-from pydantic import BaseModel, model_validator
+from typing import Any, Literal, Optional
+import orjson
+from pydantic import BaseModel, ValidationError, model_validator
 
 logger = logging.getLogger("alexa-os")
 
 # Default config file location (next to server source)
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "mcp_servers.json"
 
+# Last config read from or written to disk, with its name and url indices:
+# (path, st_mtime_ns, st_size, config, by_name, by_url)
+_CONFIG_CACHE: Optional[tuple[Path, int, int, "MCPConfig", dict, dict]] = None
+
 
 class MCPServerConfig(BaseModel):
     """Configuration for a single MCP server.
@@ -36,6 +42,18 @@ class MCPServerConfig(BaseModel):
     # Common fields
     enabled: bool = True
     allowed_tools: Optional[list[str]] = None  # None means all tools allowed
+    tools_ttl: Optional[float] = None  # Seconds before cached tools are re-fetched on use (None = manager default)
+
+    @property
+    def allowed_tools_set(self) -> Optional[frozenset[str]]:
+        """
+        allowed_tools as a frozenset for O(1) membership checks.
+
+        None means all tools are allowed. Build it once per filtering pass
+        rather than testing `name in allowed_tools` per tool. Not cached on
+        the model because model_copy would carry a stale value along.
+        """
+        return None if self.allowed_tools is None else frozenset(self.allowed_tools)
 
     @model_validator(mode='after')
     def validate_type_fields(self):
@@ -61,30 +79,71 @@ def get_config_path() -> Path:
     return DEFAULT_CONFIG_PATH
 
 
-def load_config() -> MCPConfig:
+def _index(config: MCPConfig) -> tuple[dict[str, MCPServerConfig], dict[str, MCPServerConfig]]:
+    """Build name -> server and url -> server lookups for a config."""
+    by_name = {s.name: s for s in config.servers}
+    by_url = {s.url: s for s in config.servers if s.url}
+    return by_name, by_url
+
+
+def _load_and_index() -> tuple[MCPConfig, dict[str, MCPServerConfig], dict[str, MCPServerConfig]]:
     """
-    Load MCP configuration from JSON file.
+    Load the cached MCP configuration along with its name and url indices.
 
-    Returns an empty config if file doesn't exist.
+    The returned objects are shared with the cache and must not be mutated;
+    use load_config() for a private copy.
     """
+    global _CONFIG_CACHE
     config_path = get_config_path()
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         logger.info(f"MCP config file not found at {config_path}, using empty config")
-        return MCPConfig(servers=[])
+        return MCPConfig(servers=[]), {}, {}
+
+    if _CONFIG_CACHE is not None:
+        cached_path, mtime_ns, size, config, by_name, by_url = _CONFIG_CACHE
+        if (cached_path, mtime_ns, size) == (config_path, stat.st_mtime_ns, stat.st_size):
+            return config, by_name, by_url
 
     try:
-        with open(config_path, "r") as f:
-            data = json.load(f)
-        config = MCPConfig.model_validate(data)
+        # The file may be hand-edited (see mcp_servers.json.example), so it is
+        # always validated; parsing and validation happen in one pass in
+        # pydantic-core. A file save_config just wrote is served from the
+        # cache above and never re-read.
+        config = MCPConfig.model_validate_json(config_path.read_bytes())
+        by_name, by_url = _index(config)
+        _CONFIG_CACHE = (config_path, stat.st_mtime_ns, stat.st_size, config, by_name, by_url)
         logger.info(f"Loaded MCP config with {len(config.servers)} server(s)")
-        return config
-    except json.JSONDecodeError as e:
+        return config, by_name, by_url
+    except ValidationError as e:
         logger.error(f"Failed to parse MCP config file: {e}")
-        return MCPConfig(servers=[])
+        return MCPConfig(servers=[]), {}, {}
     except Exception as e:
         logger.error(f"Failed to load MCP config: {e}")
-        return MCPConfig(servers=[])
+        return MCPConfig(servers=[]), {}, {}
+
+
+def load_config() -> MCPConfig:
+    """
+    Load MCP configuration from JSON file.
+
+    Returns an empty config if file doesn't exist. The parsed config is
+    cached and reused until the file's mtime or size changes; callers get
+    their own copy so they can mutate it freely.
+    """
+    return _load_and_index()[0].model_copy(deep=True)
+
+
+def load_config_readonly() -> MCPConfig:
+    """
+    Load MCP configuration without copying it.
+
+    Returns the cached config itself, so callers must treat it (and its
+    servers) as read-only. Used on hot paths that only read server fields.
+    """
+    return _load_and_index()[0]
 
 
 def save_config(config: MCPConfig) -> bool:
@@ -93,22 +152,72 @@ def save_config(config: MCPConfig) -> bool:
 
     Returns True on success, False on failure.
     """
+    global _CONFIG_CACHE
     config_path = get_config_path()
+    tmp_path = config_path.with_suffix(config_path.suffix + ".tmp")
 
     try:
         # Ensure parent directory exists
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(config_path, "w") as f:
-            json.dump(config.model_dump(), f, indent=2)
+        # Serialize fully, write a sibling temp file, then swap it in so a
+        # crash mid-write never leaves a truncated config behind
+        buf = orjson.dumps(config.model_dump(), option=orjson.OPT_INDENT_2)
+        tmp_path.write_bytes(buf)
+        os.replace(tmp_path, config_path)
 
+        stat = config_path.stat()
+        cached = config.model_copy(deep=True)
+        _CONFIG_CACHE = (config_path, stat.st_mtime_ns, stat.st_size, cached, *_index(cached))
         logger.info(f"Saved MCP config with {len(config.servers)} server(s)")
         return True
     except Exception as e:
         logger.error(f"Failed to save MCP config: {e}")
+        tmp_path.unlink(missing_ok=True)
         return False
 
 
+@contextmanager
+def edit_config() -> Iterator[MCPConfig]:
+    """
+    Batch several edits into a single load and save.
+
+    Yields a private copy of the config. Pass it as `_cfg` to add_server,
+    remove_server, toggle_server or update_allowed_tools to edit it in place;
+    it is written once when the block exits without an exception.
+
+    Raises OSError if the final save fails.
+    """
+    config = load_config()
+    yield config
+    if not save_config(config):
+        raise OSError("Failed to save configuration")
+
+
+def _load_for_edit(
+    _cfg: Optional[MCPConfig],
+) -> tuple[MCPConfig, dict[str, MCPServerConfig], dict[str, MCPServerConfig]]:
+    """Return the config to edit with its indices: the open batch, or the cached config."""
+    if _cfg is None:
+        return _load_and_index()
+    return _cfg, *_index(_cfg)
+
+
+def _apply(config: MCPConfig, _cfg: Optional[MCPConfig]) -> bool:
+    """Stage an edited config into the open batch, or save it immediately."""
+    if _cfg is None:
+        return save_config(config)
+    _cfg.servers = config.servers
+    return True
+
+
+def _replace_server(config: MCPConfig, server: MCPServerConfig) -> MCPConfig:
+    """Return a new config with the same-named server swapped for `server`."""
+    return MCPConfig.model_construct(
+        servers=[server if s.name == server.name else s for s in config.servers]
+    )
+
+
 def add_server(
     name: str,
     server_type: Literal["http", "stdio"] = "http",
@@ -123,6 +232,7 @@ def add_server(
     # Common fields
     enabled: bool = True,
     allowed_tools: Optional[list[str]] = None,
+    _cfg: Optional[MCPConfig] = None,
 ) -> tuple[bool, str]:
     """
     Add a new MCP server to the configuration.
@@ -132,15 +242,15 @@ def add_server(
 
     Returns (success, message) tuple.
     """
-    config = load_config()
+    config, by_name, by_url = _load_for_edit(_cfg)
 
     # Check for duplicate names
-    if any(s.name == name for s in config.servers):
+    if name in by_name:
         return False, f"Server with name '{name}' already exists"
 
     # Check for duplicate URLs (HTTP only)
     if server_type == "http" and url:
-        if any(s.url == url for s in config.servers):
+        if url in by_url:
             return False, f"Server with URL '{url}' already exists"
 
     try:
@@ -159,9 +269,9 @@ def add_server(
     except ValueError as e:
         return False, str(e)
 
-    config.servers.append(new_server)
+    config = MCPConfig.model_construct(servers=[*config.servers, new_server])
 
-    if save_config(config):
+    if _apply(config, _cfg):
         if server_type == "http":
             logger.info(f"Added HTTP MCP server: {name} ({url})")
         else:
@@ -171,28 +281,31 @@ def add_server(
         return False, "Failed to save configuration"
 
 
-def remove_server(name: str) -> tuple[bool, str]:
+def remove_server(name: str, _cfg: Optional[MCPConfig] = None) -> tuple[bool, str]:
     """
     Remove an MCP server from the configuration.
 
     Returns (success, message) tuple.
     """
-    config = load_config()
-
-    original_count = len(config.servers)
-    config.servers = [s for s in config.servers if s.name != name]
+    config, by_name, _ = _load_for_edit(_cfg)
 
-    if len(config.servers) == original_count:
+    if name not in by_name:
         return False, f"Server '{name}' not found"
 
-    if save_config(config):
+    config = MCPConfig.model_construct(servers=[s for s in config.servers if s.name != name])
+
+    if _apply(config, _cfg):
         logger.info(f"Removed MCP server: {name}")
         return True, f"Removed server '{name}'"
     else:
         return False, "Failed to save configuration"
 
 
-def toggle_server(name: str, enabled: Optional[bool] = None) -> tuple[bool, str]:
+def toggle_server(
+    name: str,
+    enabled: Optional[bool] = None,
+    _cfg: Optional[MCPConfig] = None,
+) -> tuple[bool, str]:
     """
     Toggle or set the enabled state of an MCP server.
 
@@ -201,26 +314,33 @@ def toggle_server(name: str, enabled: Optional[bool] = None) -> tuple[bool, str]
 
     Returns (success, message) tuple.
     """
-    config = load_config()
+    config, by_name, _ = _load_for_edit(_cfg)
 
-    for server in config.servers:
-        if server.name == name:
-            if enabled is None:
-                server.enabled = not server.enabled
-            else:
-                server.enabled = enabled
-
-            if save_config(config):
-                state = "enabled" if server.enabled else "disabled"
-                logger.info(f"Toggled MCP server {name} to {state}")
-                return True, f"Server '{name}' is now {state}"
-            else:
-                return False, "Failed to save configuration"
+    server = by_name.get(name)
+    if server is None:
+        return False, f"Server '{name}' not found"
 
-    return False, f"Server '{name}' not found"
+    if enabled is None:
+        enabled = not server.enabled
+    elif enabled == server.enabled:
+        # Already in the requested state - skip the rewrite
+        state = "enabled" if enabled else "disabled"
+        return True, f"Server '{name}' is already {state}"
+    server = server.model_copy(update={"enabled": enabled})
+
+    if _apply(_replace_server(config, server), _cfg):
+        state = "enabled" if server.enabled else "disabled"
+        logger.info(f"Toggled MCP server {name} to {state}")
+        return True, f"Server '{name}' is now {state}"
+    else:
+        return False, "Failed to save configuration"
 
 
-def update_allowed_tools(name: str, allowed_tools: Optional[list[str]]) -> tuple[bool, str]:
+def update_allowed_tools(
+    name: str,
+    allowed_tools: Optional[list[str]],
+    _cfg: Optional[MCPConfig] = None,
+) -> tuple[bool, str]:
     """
     Update the allowed tools for an MCP server.
 
@@ -230,26 +350,29 @@ def update_allowed_tools(name: str, allowed_tools: Optional[list[str]]) -> tuple
 
     Returns (success, message) tuple.
     """
-    config = load_config()
+    config, by_name, _ = _load_for_edit(_cfg)
+
+    server = by_name.get(name)
+    if server is None:
+        return False, f"Server '{name}' not found"
 
-    for server in config.servers:
-        if server.name == name:
-            server.allowed_tools = allowed_tools
+    if server.allowed_tools == allowed_tools:
+        return True, f"Server '{name}' allowed tools unchanged"
 
-            if save_config(config):
-                if allowed_tools is None:
-                    msg = f"Server '{name}' now allows all tools"
-                elif len(allowed_tools) == 0:
-                    msg = f"Server '{name}' now has all tools disabled"
-                else:
-                    msg = f"Server '{name}' now allows {len(allowed_tools)} tool(s)"
+    server = server.model_copy(update={"allowed_tools": allowed_tools})
 
-                logger.info(msg)
-                return True, msg
-            else:
-                return False, "Failed to save configuration"
+    if _apply(_replace_server(config, server), _cfg):
+        if allowed_tools is None:
+            msg = f"Server '{name}' now allows all tools"
+        elif len(allowed_tools) == 0:
+            msg = f"Server '{name}' now has all tools disabled"
+        else:
+            msg = f"Server '{name}' now allows {len(allowed_tools)} tool(s)"
 
-    return False, f"Server '{name}' not found"
+        logger.info(msg)
+        return True, msg
+    else:
+        return False, "Failed to save configuration"
 
 
 def get_server(name: str) -> Optional[MCPServerConfig]:
@@ -258,11 +381,18 @@ def get_server(name: str) -> Optional[MCPServerConfig]:
 
     Returns None if not found.
     """
-    config = load_config()
-    for server in config.servers:
-        if server.name == name:
-            return server
-    return None
+    server = _load_and_index()[1].get(name)
+    return server.model_copy(deep=True) if server is not None else None
+
+
+def get_server_readonly(name: str) -> Optional[MCPServerConfig]:
+    """
+    Get a specific MCP server configuration by name without copying it.
+
+    Like load_config_readonly, the returned config is shared and must not
+    be mutated. Returns None if not found.
+    """
+    return _load_and_index()[1].get(name)
 
 
 def get_enabled_servers() -> list[MCPServerConfig]:
@@ -271,3 +401,34 @@ def get_enabled_servers() -> list[MCPServerConfig]:
     """
     config = load_config()
     return [s for s in config.servers if s.enabled]
+
+
+_BULK_OPS = {
+    "add": add_server,
+    "remove": remove_server,
+    "toggle": toggle_server,
+    "update_allowed_tools": update_allowed_tools,
+}
+
+
+def bulk_update(ops: list[tuple[str, dict[str, Any]]]) -> list[tuple[bool, str]]:
+    """
+    Apply several config edits with a single load and save.
+
+    Each op is (kind, kwargs) where kind is one of "add", "remove", "toggle"
+    or "update_allowed_tools" and kwargs are the matching function's arguments.
+
+    Returns a (success, message) tuple per op.
+    """
+    results: list[tuple[bool, str]] = []
+    try:
+        with edit_config() as config:
+            for kind, kwargs in ops:
+                op = _BULK_OPS.get(kind)
+                if op is None:
+                    results.append((False, f"Unknown operation '{kind}'"))
+                    continue
+                results.append(op(**kwargs, _cfg=config))
+    except OSError as e:
+        return [(False, str(e)) if ok else (ok, msg) for ok, msg in results]
+    return results
@@ -1,66 +1,262 @@
 """MCP Server Manager for dynamic MCP server connections."""
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Union
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
 import httpx
+import orjson
 from livekit.agents.llm import mcp as lk_mcp
 
 from . import mcp_config
+from .config import settings
 from .mcp_config import MCPServerConfig
 
 logger = logging.getLogger("alexa-os")
 
+# tools/list request body never changes, so serialize it once
+_TOOLS_LIST_BODY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/list",
+    "params": {}
+})
 
-async def fetch_mcp_tools(url: str, headers: Optional[dict[str, str]] = None) -> list[dict]:
+# MCP JSON-RPC requires proper content-type headers
+# OpenMemory MCP requires Accept to include both json and event-stream
+_TOOLS_LIST_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream",
+}
+
+
+def _tools_cache_path(url: str, headers: Optional[dict[str, str]]) -> Path:
+    """On-disk cache file for a server's tools/list response."""
+    key = hashlib.sha256(
+        url.encode() + orjson.dumps(headers or {}, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+    return Path(settings.model_cache_dir) / "mcp_tools" / f"{key}.json"
+
+
+def _read_cached_tools(path: Path) -> Optional[list[dict]]:
+    """Return cached tools if the cache file is younger than the TTL."""
+    try:
+        if time.time() - path.stat().st_mtime > settings.mcp_tools_cache_ttl:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _write_cached_tools(path: Path, tools: list[dict]) -> None:
+    """Atomically replace the cache file with a fresh tools/list response."""
+    tmp = path.with_suffix(".json.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(orjson.dumps(tools))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Failed to cache MCP tools at {path}: {e}")
+        tmp.unlink(missing_ok=True)
+
+
+# Per-stage budgets for MCP HTTP calls, so an unreachable host fails at
+# connect time instead of consuming the whole request budget
+MCP_CONNECT_TIMEOUT = 3.0
+MCP_READ_TIMEOUT = 10.0
+MCP_WRITE_TIMEOUT = 5.0
+MCP_POOL_TIMEOUT = 2.0
+
+# tools/list attempts on transport errors or 5xx, with exponential backoff
+MCP_FETCH_ATTEMPTS = 3
+MCP_RETRY_BACKOFF = 0.2
+# Default age (seconds) after which get_cached_tools re-fetches a server's tools
+MCP_TOOLS_TTL = 300.0
+
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+# tools/list requests in flight, keyed by their cache path (url + headers)
+_INFLIGHT_FETCHES: dict[Path, asyncio.Future] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for MCP JSON-RPC calls.
+
+    Created on first use and kept for the life of the process so repeated
+    tools/list calls reuse pooled keepalive connections.
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(
+                connect=MCP_CONNECT_TIMEOUT,
+                read=MCP_READ_TIMEOUT,
+                write=MCP_WRITE_TIMEOUT,
+                pool=MCP_POOL_TIMEOUT,
+            ),
+        )
+    return _HTTP_CLIENT
+
+
+async def close_http_client():
+    """Close the shared HTTP client, if it was ever created."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
+async def fetch_mcp_tools(
+    url: str,
+    headers: Optional[dict[str, str]] = None,
+    force: bool = False,
+) -> list[dict]:
     """
     Fetch tools from an MCP server via JSON-RPC.
 
     Makes a direct HTTP call to the MCP server's tools/list method
     to get raw tool metadata before LiveKit wraps them as functions.
+    Uses the shared client from get_http_client() so repeated fetches
+    reuse pooled connections.
+
+    Successful responses are cached on disk per (url, headers) for
+    MCP_TOOLS_CACHE_TTL seconds; pass force=True to bypass the cache.
+
+    Concurrent calls for the same (url, headers) share one request, so
+    several configured servers behind the same endpoint cost one round-trip.
 
     Returns list of tool dicts with name, description, inputSchema.
+    The list may be shared between callers and must not be mutated.
     """
-    logger.info(f"[DEBUG] fetch_mcp_tools called for URL: {url}")
-    try:
-        # MCP JSON-RPC requires proper content-type headers
-        # OpenMemory MCP requires Accept to include both json and event-stream
-        request_headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-        }
-        # Merge with any custom headers (e.g., Authorization)
-        if headers:
-            request_headers.update(headers)
+    logger.debug("fetch_mcp_tools called for URL: %s", url)
+    cache_path = _tools_cache_path(url, headers)
+    if not force and settings.mcp_tools_cache_ttl > 0:
+        cached = _read_cached_tools(cache_path)
+        if cached is not None:
+            logger.info(f"Using cached tool list for MCP server at {url} ({len(cached)} tools)")
+            return cached
+
+    inflight = _INFLIGHT_FETCHES.get(cache_path)
+    if inflight is None:
+        inflight = asyncio.ensure_future(_request_tools(url, headers, cache_path))
+        _INFLIGHT_FETCHES[cache_path] = inflight
+        inflight.add_done_callback(lambda _: _INFLIGHT_FETCHES.pop(cache_path, None))
+    # Shielded so one caller being cancelled doesn't cancel the shared request
+    return await asyncio.shield(inflight)
+
+
+async def _post_with_retry(url: str, headers: dict[str, str]) -> httpx.Response:
+    """
+    POST tools/list, retrying transport errors and 5xx responses with backoff.
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
+    Retries reuse the pooled keepalive connection, which is far cheaper than
+    the full reconnect a failed fetch would otherwise lead to.
+    """
+    for attempt in range(MCP_FETCH_ATTEMPTS):
+        last_attempt = attempt == MCP_FETCH_ATTEMPTS - 1
+        try:
+            response = await get_http_client().post(
                 url,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "tools/list",
-                    "params": {}
-                },
-                headers=request_headers
+                content=_TOOLS_LIST_BODY,
+                headers=headers
             )
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"[DEBUG] MCP response keys: {list(data.keys())}")
-
-            if "error" in data:
-                logger.error(f"MCP tools/list error: {data['error']}")
-                return []
-
-            tools = data.get("result", {}).get("tools", [])
-            logger.info(f"[DEBUG] Fetched {len(tools)} tools from MCP server at {url}")
-            if tools:
-                logger.info(f"[DEBUG] Tool names: {[t.get('name', '?') for t in tools]}")
-            return tools
+        except httpx.TransportError as e:
+            if last_attempt:
+                raise
+            logger.warning(f"tools/list to {url} failed ({e}), retrying")
+        else:
+            if response.status_code < 500 or last_attempt:
+                return response
+            logger.warning(f"tools/list to {url} returned {response.status_code}, retrying")
+        await asyncio.sleep(MCP_RETRY_BACKOFF * 2 ** attempt)
+
+
+async def _request_tools(
+    url: str,
+    headers: Optional[dict[str, str]],
+    cache_path: Path,
+) -> list[dict]:
+    """POST tools/list to an MCP server and cache a successful result."""
+    try:
+        # Merge with any custom headers (e.g., Authorization)
+        request_headers = {**_TOOLS_LIST_HEADERS, **headers} if headers else _TOOLS_LIST_HEADERS
+
+        response = await _post_with_retry(url, request_headers)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        logger.debug("MCP response keys: %s", data.keys())
+
+        if "error" in data:
+            logger.error(f"MCP tools/list error: {data['error']}")
+            return []
+
+        tools = data.get("result", {}).get("tools", [])
+        logger.debug("Fetched %d tools from MCP server at %s", len(tools), url)
+        if tools and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tool names: %s", [t.get("name", "?") for t in tools])
+        if settings.mcp_tools_cache_ttl > 0:
+            _write_cached_tools(cache_path, tools)
+        return tools
     except Exception as e:
         logger.error(f"Failed to fetch MCP tools from {url}: {e}")
         return []
 
 
+async def _prewarm_connection(url: str):
+    """Open a pooled keepalive connection to an MCP host ahead of tools/list."""
+    try:
+        await get_http_client().head(url, timeout=3.0)
+    except httpx.HTTPError:
+        pass
+
+
+def _tool_summary(tool: dict) -> dict:
+    """Keep only the tool fields the UI lists; schemas are left to LiveKit's own session."""
+    return {"name": tool.get("name", "unknown"), "description": tool.get("description") or ""}
+
+
+def _fingerprint(*fields) -> bytes:
+    """Stable digest of config fields, so later comparisons are one bytes ==."""
+    return hashlib.blake2b(
+        orjson.dumps(fields, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).digest()
+
+
+def _connection_fingerprint(config: MCPServerConfig) -> bytes:
+    """Digest of the fields that require a reconnect when they change."""
+    if config.type == "http":
+        return _fingerprint(config.type, config.url)
+    return _fingerprint(config.type, config.command, config.args, config.env, config.cwd)
+
+
+def _headers_fingerprint(config: MCPServerConfig) -> bytes:
+    """Digest of the HTTP headers, which can be swapped on a live session."""
+    return _fingerprint(config.headers if config.type == "http" else None)
+
+
+@dataclass(slots=True)
+class ServerRecord:
+    """Everything tracked for one connected MCP server."""
+    server: Union[lk_mcp.MCPServerHTTP, lk_mcp.MCPServerStdio]
+    config: MCPServerConfig
+    tools: list[dict]  # name/description of each tool fetched via MCP JSON-RPC
+    tools_stale: bool = False  # set by invalidate_tool_cache, forces the next fetch
+    fetched_at: float = field(default_factory=time.monotonic)  # when tools was last fetched
+    connection_fp: bytes = field(init=False)
+    headers_fp: bytes = field(init=False)
+
+    def __post_init__(self):
+        self.connection_fp = _connection_fingerprint(self.config)
+        self.headers_fp = _headers_fingerprint(self.config)
+
+
 class MCPServerManager:
     """
     Manages MCP server connections with dynamic add/remove/toggle support.
@@ -73,45 +269,143 @@ class MCPServerManager:
 
     def __init__(self, rpc_handlers):
         # Server instances (can be MCPServerHTTP or MCPServerStdio)
-        self._servers: dict[str, Union[lk_mcp.MCPServerHTTP, lk_mcp.MCPServerStdio]] = {}
-        self._server_configs: dict[str, MCPServerConfig] = {}  # name -> config
-        self._tool_cache: dict[str, list[dict]] = {}  # name -> list of tool metadata
+        # name -> server instance (MCPServerHTTP or MCPServerStdio), config and tools
+        self._state: dict[str, ServerRecord] = {}
+        # Bumped whenever _state changes; the tool cache view is rebuilt lazily
+        self._cache_version = 0
+        self._tool_cache_view: Optional[Mapping[str, list[dict]]] = None
+        self._servers_list: Optional[list] = None
         self._rpc_handlers = rpc_handlers
+        # Digest of the config file as of the last load/reload that connected
+        # every enabled server; None forces the next reload to run
+        self._last_config_digest: Optional[bytes] = None
 
     @property
     def servers(self) -> list:
-        """Return list of active MCP server instances."""
-        return list(self._servers.values())
+        """
+        Return list of active MCP server instances.
 
-    def get_cached_tools(self, server_name: str) -> list[dict]:
-        """Get cached tool metadata for a server."""
-        return self._tool_cache.get(server_name, [])
+        The list is cached until a server connects or disconnects; callers
+        must not mutate it.
+        """
+        if self._servers_list is None:
+            self._servers_list = [record.server for record in self._state.values()]
+        return self._servers_list
 
-    def get_all_cached_tools(self) -> dict[str, list[dict]]:
-        """Get all cached tool metadata."""
-        return self._tool_cache.copy()
+    async def get_cached_tools(self, server_name: str) -> list[dict]:
+        """
+        Get cached tool metadata for a server, refreshing it if expired.
+
+        Entries older than the server's tools_ttl (MCP_TOOLS_TTL by default)
+        or marked stale by invalidate_tool_cache are re-fetched here, so only
+        servers that are actually queried pay for a refresh.
+        """
+        record = self._state.get(server_name)
+        if record is None:
+            return []
+
+        ttl = record.config.tools_ttl
+        if ttl is None:
+            ttl = MCP_TOOLS_TTL
+        if record.tools_stale or time.monotonic() - record.fetched_at > ttl:
+            tools = await self._fetch_tools_from_server(
+                server_name, record.server, record.config, force=True
+            )
+            # The server may have been removed or reconnected while fetching
+            if self._state.get(server_name) is record:
+                record.tools = tools
+                record.fetched_at = time.monotonic()
+                record.tools_stale = False
+                self._state_changed()
+                self._publish_to_rpc()
+        return record.tools
+
+    async def refresh_tools(self, server_name: Optional[str] = None, force: bool = False):
+        """
+        Bring cached tool lists up to date before the tool-listing RPCs read them.
+
+        Only expired or stale entries are re-fetched; force marks them stale
+        first (the playground's Refresh button).
+        """
+        names = [server_name] if server_name else list(self._state)
+        if force:
+            for name in names:
+                self.invalidate_tool_cache(name)
+        await asyncio.gather(*(self.get_cached_tools(name) for name in names))
+
+    def get_all_cached_tools(self) -> Mapping[str, list[dict]]:
+        """Get a read-only view of all cached tool metadata."""
+        if self._tool_cache_view is None:
+            self._tool_cache_view = MappingProxyType(
+                {name: record.tools for name, record in self._state.items()}
+            )
+        return self._tool_cache_view
+
+    def invalidate_tool_cache(self, server_name: str):
+        """Mark a server's cached tool list stale so the next update re-fetches it."""
+        record = self._state.get(server_name)
+        if record is None:
+            return
+        record.tools_stale = True
+        # LiveKit keeps its own copy of the raw tool list per server
+        if hasattr(record.server, "invalidate_cache"):
+            record.server.invalidate_cache()
+
+    def _state_changed(self):
+        """Invalidate the cached server list and tool cache view after _state changes."""
+        self._cache_version += 1
+        self._tool_cache_view = None
+        self._servers_list = None
+
+    def _publish_to_rpc(self):
+        """Push the current server list and tool cache to the RPC handlers."""
+        self._rpc_handlers.set_mcp_servers(self.servers)
+        self._rpc_handlers.set_mcp_tool_cache(
+            self.get_all_cached_tools(), version=self._cache_version
+        )
 
     async def load_from_config(self):
         """Load and connect to all enabled MCP servers from config."""
-        config = mcp_config.load_config()
+        digest = self._config_digest()
+        config = mcp_config.load_config_readonly()
         enabled_servers = [s for s in config.servers if s.enabled]
 
         logger.info(f"Loading {len(enabled_servers)} enabled MCP server(s) from config")
 
-        for server_cfg in enabled_servers:
-            await self._connect_server(server_cfg)
+        # Connect concurrently so startup costs the slowest server, not the sum
+        results = await asyncio.gather(
+            *(self._connect_server(server_cfg) for server_cfg in enabled_servers),
+            return_exceptions=True,
+        )
+        for server_cfg, result in zip(enabled_servers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to connect MCP server '{server_cfg.name}': {result}")
 
         # Update RPC handlers with server list and tool cache
-        self._rpc_handlers.set_mcp_servers(self.servers)
-        self._rpc_handlers.set_mcp_tool_cache(self._tool_cache)
+        self._publish_to_rpc()
 
-        logger.info(f"MCP servers loaded: {len(self._servers)} connected")
+        all_connected = all(s.name in self._state for s in enabled_servers)
+        self._last_config_digest = digest if all_connected else None
+        logger.info(f"MCP servers loaded: {len(self._state)} connected")
 
-    async def _connect_server(self, config: MCPServerConfig) -> bool:
+    def _config_digest(self) -> bytes:
+        """Hash the raw config file so unchanged configs can be detected cheaply."""
+        try:
+            raw = mcp_config.get_config_path().read_bytes()
+        except FileNotFoundError:
+            raw = b""
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    async def _connect_server(
+        self,
+        config: MCPServerConfig,
+        cached_tools: Optional[list[dict]] = None,
+    ) -> bool:
         """
         Connect to a single MCP server and track its status.
 
-        Supports both HTTP and Stdio transport types.
+        Supports both HTTP and Stdio transport types. If cached_tools is
+        given it is reused instead of fetching tools/list again.
         Returns True if connection successful.
         """
         name = config.name
@@ -130,16 +424,28 @@ class MCPServerManager:
                 logger.info(f"Connecting to HTTP MCP server '{name}' at {config.url}")
                 server = lk_mcp.MCPServerHTTP(url=config.url, headers=config.headers)
 
+            # When tools/list will go through the shared pool rather than the
+            # server's own session, open that connection while initialize runs
+            prewarm = None
+            if server_type == "http" and not hasattr(server, "_list_raw_tools"):
+                prewarm = asyncio.create_task(_prewarm_connection(config.url))
+
             # Initialize the server (required for stdio servers to spawn process)
-            await server.initialize()
+            try:
+                await server.initialize()
+            finally:
+                if prewarm is not None:
+                    await prewarm
 
             # Fetch tools from the connected server
-            tools = await self._fetch_tools_from_server(name, server, config)
-            self._tool_cache[name] = tools
+            if cached_tools is not None:
+                tools = cached_tools
+            else:
+                tools = await self._fetch_tools_from_server(name, server, config)
 
-            # Store the server and config
-            self._servers[name] = server
-            self._server_configs[name] = config
+            # Store the server, config and tools together
+            self._state[name] = ServerRecord(server, config, tools)
+            self._state_changed()
 
             # Update status with tool count
             self._rpc_handlers.set_mcp_server_status(
@@ -157,28 +463,41 @@ class MCPServerManager:
         self,
         name: str,
         server: Union[lk_mcp.MCPServerHTTP, lk_mcp.MCPServerStdio],
-        config: MCPServerConfig
+        config: MCPServerConfig,
+        force: bool = False,
     ) -> list[dict]:
         """
         Fetch tools from a connected MCP server.
 
-        For HTTP servers, uses the direct JSON-RPC call.
-        For Stdio servers, uses the initialized client session.
+        Prefers the server's own initialized MCP session (LiveKit's
+        _list_raw_tools). That saves a second connection, and LiveKit keeps
+        the result, so the agent's later list_tools() doesn't fetch again.
+        Falls back to a direct JSON-RPC call for HTTP servers, or to the raw
+        client session for stdio, on LiveKit versions without it.
+
+        Only name and description are kept. The cache backs tool listing
+        in the UI, and LiveKit reads input schemas through its own MCP
+        session, so holding every schema here is wasted memory.
         """
         try:
+            if hasattr(server, "_list_raw_tools") and server.initialized:
+                if force:
+                    server.invalidate_cache()
+                raw_tools = await server._list_raw_tools()
+                return [
+                    {"name": tool.name, "description": tool.description or ""}
+                    for tool in raw_tools
+                ]
             if config.type == "http":
                 # Use direct HTTP call for HTTP servers
-                return await fetch_mcp_tools(config.url, config.headers)
+                tools = await fetch_mcp_tools(config.url, config.headers, force=force)
+                return [_tool_summary(tool) for tool in tools]
             else:
                 # Use the client session for stdio servers
                 if hasattr(server, '_client') and server._client:
                     result = await server._client.list_tools()
                     return [
-                        {
-                            "name": tool.name,
-                            "description": tool.description or "",
-                            "inputSchema": tool.inputSchema if hasattr(tool, 'inputSchema') else {},
-                        }
+                        {"name": tool.name, "description": tool.description or ""}
                         for tool in result.tools
                     ]
                 else:
@@ -190,9 +509,9 @@ class MCPServerManager:
 
     async def _disconnect_server(self, name: str):
         """Disconnect from an MCP server."""
-        if name in self._servers:
+        if name in self._state:
             try:
-                server = self._servers[name]
+                server = self._state[name].server
                 # LiveKit MCP servers have aclose() for async cleanup
                 if hasattr(server, "aclose"):
                     await server.aclose()
@@ -203,9 +522,8 @@ class MCPServerManager:
             except Exception as e:
                 logger.warning(f"Error disconnecting from MCP server '{name}': {e}")
 
-            del self._servers[name]
-            self._server_configs.pop(name, None)
-            self._tool_cache.pop(name, None)
+            del self._state[name]
+            self._state_changed()
             logger.info(f"Disconnected from MCP server '{name}'")
 
     async def reload(self):
@@ -214,78 +532,139 @@ class MCPServerManager:
 
         Handles add/remove/toggle changes by comparing current state
         with config and making necessary connections/disconnections.
+        Returns immediately if the config file is byte-identical to the
+        last load and every enabled server is connected.
         """
-        config = mcp_config.load_config()
+        digest = self._config_digest()
+        if digest == self._last_config_digest:
+            logger.info("MCP config unchanged, skipping reload")
+            return
+
+        config = mcp_config.load_config_readonly()
 
-        current_servers = set(self._servers.keys())
-        config_servers = {s.name: s for s in config.servers}
-        enabled_servers = {s.name for s in config.servers if s.enabled}
+        enabled_configs = {s.name: s for s in config.servers if s.enabled}
+        enabled_servers = enabled_configs.keys()
+        current_servers = self._state.keys()
 
         # Disconnect servers that were removed or disabled
-        for name in current_servers:
-            if name not in config_servers or name not in enabled_servers:
-                await self._disconnect_server(name)
-
-        # Connect new or re-enabled servers, or reconnect if config changed
-        for name in enabled_servers:
-            new_cfg = config_servers[name]
-            if name not in self._servers:
-                # New server
-                await self._connect_server(new_cfg)
-            else:
-                # Check if config changed (URL for HTTP, command for stdio)
-                old_cfg = self._server_configs.get(name)
-                if old_cfg and self._config_changed(old_cfg, new_cfg):
-                    await self._disconnect_server(name)
-                    await self._connect_server(new_cfg)
+        jobs = [self._disconnect_server(name) for name in current_servers - enabled_servers]
+
+        # Connect new or re-enabled servers
+        jobs += [self._connect_server(enabled_configs[name]) for name in enabled_servers - current_servers]
+
+        # Reconnect if config changed (URL for HTTP, command for stdio)
+        for name in enabled_servers & current_servers:
+            new_cfg = enabled_configs[name]
+            record = self._state[name]
+            if record.connection_fp != _connection_fingerprint(new_cfg):
+                jobs.append(self._reconnect_server(new_cfg))
+            elif record.headers_fp != _headers_fingerprint(new_cfg):
+                # e.g. a rotated bearer token - no need to tear down the session
+                jobs.append(self._update_headers_or_reconnect(new_cfg))
+
+        # Every server's teardown/connect pipeline runs independently, so one
+        # slow shutdown doesn't hold up connecting the others
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"MCP server reload step failed: {result}")
 
         # Update RPC handlers
-        self._rpc_handlers.set_mcp_servers(self.servers)
-        self._rpc_handlers.set_mcp_tool_cache(self._tool_cache)
+        self._publish_to_rpc()
 
-        logger.info(f"MCP servers reloaded: {len(self._servers)} active")
+        all_connected = all(name in self._state for name in enabled_servers)
+        self._last_config_digest = digest if all_connected else None
+        logger.info(f"MCP servers reloaded: {len(self._state)} active")
 
-    def _config_changed(self, old: MCPServerConfig, new: MCPServerConfig) -> bool:
-        """Check if server config has changed in a way that requires reconnection."""
-        if old.type != new.type:
+    async def _reconnect_server(self, config: MCPServerConfig, force_refresh: bool = True) -> bool:
+        """
+        Disconnect a server and connect it again with a new config.
+
+        With force_refresh=False the previous tool list is carried over
+        (unless invalidated) instead of re-fetching tools/list.
+        """
+        previous = self._state.get(config.name)
+        cached_tools = None
+        if not force_refresh and previous is not None and not previous.tools_stale:
+            cached_tools = previous.tools
+        await self._disconnect_server(config.name)
+        return await self._connect_server(config, cached_tools=cached_tools)
+
+    async def _update_headers_or_reconnect(self, config: MCPServerConfig) -> bool:
+        """Apply a header-only change in place, reconnecting if that isn't possible."""
+        if await self._update_headers(config):
             return True
-        if old.type == "http":
-            return old.url != new.url or old.headers != new.headers
-        else:  # stdio
-            return (
-                old.command != new.command or
-                old.args != new.args or
-                old.env != new.env or
-                old.cwd != new.cwd
+        # Same URL, so the tool list is still valid across the reconnect
+        return await self._reconnect_server(config, force_refresh=False)
+
+    async def _update_headers(self, config: MCPServerConfig) -> bool:
+        """
+        Apply new headers to a connected HTTP server in place.
+
+        The URL is unchanged, so the cached tool list is kept unless it was
+        invalidated. Returns False if this LiveKit version can't change headers on a live
+        server, in which case the caller falls back to a reconnect.
+        """
+        name = config.name
+        record = self._state[name]
+        if not isinstance(getattr(type(record.server), "headers", None), property):
+            return False
+
+        record.server.headers = config.headers or {}
+        record.config = config
+        record.headers_fp = _headers_fingerprint(config)
+        if record.tools_stale:
+            record.tools = await self._fetch_tools_from_server(
+                name, record.server, config, force=True
             )
+            record.fetched_at = time.monotonic()
+            record.tools_stale = False
+            self._state_changed()
+
+        self._rpc_handlers.set_mcp_server_status(
+            name, "connected", tool_count=len(record.tools)
+        )
+        logger.info(f"Updated headers for MCP server '{name}' without reconnecting")
+        return True
 
     async def add_server(self, config: MCPServerConfig) -> bool:
         """Add and connect to a new MCP server."""
-        if config.name in self._servers:
+        if config.name in self._state:
             logger.warning(f"MCP server '{config.name}' already exists")
             return False
 
+        # Connected set no longer mirrors the config file
+        self._last_config_digest = None
         success = await self._connect_server(config)
         if success:
-            self._rpc_handlers.set_mcp_servers(self.servers)
-            self._rpc_handlers.set_mcp_tool_cache(self._tool_cache)
+            self._publish_to_rpc()
         return success
 
     async def remove_server(self, name: str) -> bool:
         """Remove and disconnect from an MCP server."""
-        if name not in self._servers:
+        if name not in self._state:
             logger.warning(f"MCP server '{name}' not found")
             return False
 
+        self._last_config_digest = None
         await self._disconnect_server(name)
-        self._rpc_handlers.set_mcp_servers(self.servers)
-        self._rpc_handlers.set_mcp_tool_cache(self._tool_cache)
+        self._publish_to_rpc()
         return True
 
+    async def aclose(self):
+        """Disconnect all MCP servers and close the shared HTTP client."""
+        await asyncio.gather(
+            *(self._disconnect_server(name) for name in list(self._state)),
+            return_exceptions=True,
+        )
+        await close_http_client()
+
     def get_server_by_name(self, name: str):
         """Get an MCP server instance by name."""
-        return self._servers.get(name)
+        record = self._state.get(name)
+        return record.server if record is not None else None
 
     def get_server_config(self, name: str) -> Optional[MCPServerConfig]:
         """Get the config for a server by name."""
-        return self._server_configs.get(name)
+        record = self._state.get(name)
+        return record.config if record is not None else None
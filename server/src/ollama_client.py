@@ -0,0 +1,25 @@
+"""Shared Ollama client for native API calls (model listing, warm-up)."""
+
+import functools
+
+import httpx
+import ollama
+
+
+@functools.lru_cache(maxsize=8)
+def get_ollama_client(host: str) -> ollama.AsyncClient:
+    """
+    Return a process-wide ollama.AsyncClient for a host.
+
+    Reusing one client keeps its pooled keep-alive connections, so repeated
+    RPC calls and the startup warm-up skip the TCP handshake.
+    """
+    return ollama.AsyncClient(
+        host=host,
+        timeout=httpx.Timeout(300.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=32,
+            keepalive_expiry=300.0,
+        ),
+    )
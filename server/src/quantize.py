@@ -0,0 +1,56 @@
+"""One-time INT8 quantization of ONNX models into the model cache."""
+
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger("alexa-os.quantize")
+
+# Ops quantize_dynamic emits when it actually quantizes something
+_QUANTIZED_OPS = frozenset({"DynamicQuantizeLinear", "MatMulInteger", "ConvInteger", "DynamicQuantizeMatMul"})
+
+
+def _count_quantized_ops(graph) -> int:
+    """Count quantized nodes in a graph, including control-flow subgraphs."""
+    count = 0
+    for node in graph.node:
+        if node.op_type in _QUANTIZED_OPS:
+            count += 1
+        for attr in node.attribute:
+            if attr.g.node:
+                count += _count_quantized_ops(attr.g)
+            for subgraph in attr.graphs:
+                count += _count_quantized_ops(subgraph)
+    return count
+
+
+def quantize_onnx_once(source: Path, target: Path) -> str | None:
+    """
+    Return the path of an INT8 copy of an ONNX model, building it once.
+
+    The model is quantized with ORT dynamic quantization (QInt8 weights) and
+    written atomically to `target`. Returns None on failure, or when the
+    quantizer found nothing to quantize (e.g. weights inside If subgraphs),
+    so the caller can fall back to the float model.
+    """
+    if target.exists():
+        return str(target)
+
+    tmp_path = target.with_suffix(".onnx.tmp")
+    try:
+        import onnx
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        quantize_dynamic(str(source), str(tmp_path), weight_type=QuantType.QInt8)
+        if not _count_quantized_ops(onnx.load(str(tmp_path)).graph):
+            tmp_path.unlink()
+            logger.warning(f"Quantizing {source.name} produced no INT8 ops, using float model")
+            return None
+        os.replace(tmp_path, target)
+        logger.info(f"Built INT8 model: {target}")
+        return str(target)
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning(f"Failed to quantize {source.name}, using float model: {e}")
+        return None
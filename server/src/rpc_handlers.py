@@ -1,18 +1,37 @@
 """RPC handlers for agent control and observability."""
 
-import json
+import asyncio
+import copy
 import logging
+import math
 import os
+import time
 from pathlib import Path
-from typing import Callable, Optional, Any
+from typing import Callable, Mapping, Optional, Any
+
+import orjson
 from livekit.rtc import Room, RpcInvocationData
-import ollama
 
 from . import mcp_config
 
 # Config file for persistent agent settings (system prompt, etc.)
 AGENT_CONFIG_PATH = Path(__file__).parent.parent / "agent_config.json"
 
+# Seconds to wait after a config update before writing, so bursts of updates
+# (e.g. a UI slider streaming set_vad_settings) collapse into one write
+CONFIG_FLUSH_DELAY = 0.1
+
+# Seconds an Ollama model listing is reused, so back-to-back list_models and
+# switch_model calls share one round trip
+MODELS_CACHE_TTL = 2.0
+
+# Accepted VAD settings: (key, min, max, error returned when out of range)
+VAD_SETTING_BOUNDS = (
+    ("activation_threshold", 0.0, 1.0, "activation_threshold must be between 0.0 and 1.0"),
+    ("min_speech_duration", 0.0, math.inf, "min_speech_duration must be >= 0"),
+    ("min_silence_duration", 0.0, math.inf, "min_silence_duration must be >= 0"),
+)
+
 DEFAULT_SYSTEM_PROMPT = """You are Jarvis, a helpful voice assistant.
 
 Key behaviors:
@@ -32,6 +51,34 @@ Remember: You're speaking, not writing. Keep it brief and natural."""
 
 logger = logging.getLogger("alexa-os")
 
+_loads = orjson.loads
+
+# Status reported for configured servers the manager hasn't reported on yet
+_UNKNOWN_SERVER_STATUS = {"status": "unknown", "error": None, "tool_count": 0}
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an RPC response; LiveKit RPC handlers return str."""
+    return orjson.dumps(obj).decode()
+
+
+def _error(error: str) -> str:
+    """Serialize a failed RPC response."""
+    return _dumps({"success": False, "error": error})
+
+
+def _result(success: bool, message: str) -> str:
+    """Serialize an RPC response carrying only a status message."""
+    return _dumps({"success": success, "message": message})
+
+
+# Pre-serialized responses for validation failures whose text never varies
+_VAD_RANGE_ERRORS = {
+    key: _error(error)
+    for key, _, _, error in VAD_SETTING_BOUNDS
+}
+_NO_VAD_SETTINGS_ERROR = _error("No valid settings provided")
+
 
 class AgentRpcHandlers:
     """Manages RPC handlers for agent control."""
@@ -40,6 +87,7 @@ class AgentRpcHandlers:
         self.room = room
         self.ollama_host = ollama_host
         self._current_model: Optional[str] = None
+        self._models_cache: Optional[tuple[float, list]] = None  # (fetched_at, models)
         self._stt_model: Optional[str] = None
         self._tts_provider: Optional[str] = None
         self._vad_settings: Optional[dict] = None
@@ -47,9 +95,22 @@ class AgentRpcHandlers:
         self._on_interrupt: Optional[Callable[[], None]] = None
         self._mcp_servers: list = []
         self._mcp_server_status: dict[str, dict] = {}  # name -> {status, error, tool_count}
-        self._mcp_tool_cache: dict[str, list[dict]] = {}  # name -> list of tool metadata
+        # name -> (config the entry was built from, serialized list_mcp_servers entry)
+        self._mcp_server_fragments: dict[str, tuple[Any, bytes]] = {}
+        self._mcp_tool_cache: Mapping[str, list[dict]] = {}  # name -> list of tool metadata
+        self._mcp_tool_cache_version: Optional[int] = None
+        # Serialized responses derived from _mcp_tool_cache, reset when it changes
+        self._list_tools_response: Optional[str] = None
+        # server name -> (allowed tools the response was built for, response)
+        self._mcp_tools_responses: dict[str, tuple[Optional[frozenset[str]], str]] = {}
         self._on_mcp_change: Optional[Callable[[], Any]] = None
+        self._on_tools_requested: Optional[Callable[[Optional[str], bool], Any]] = None
         self._on_vad_change: Optional[Callable[[dict], Any]] = None
+        # Parsed agent_config.json; read once, then kept in sync by _save_config
+        self._config_cache: Optional[dict] = None
+        self._config_dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
         # System prompt
         self._system_prompt: str = self._load_system_prompt()
         self._on_system_prompt_change: Optional[Callable[[str], Any]] = None
@@ -57,22 +118,36 @@ class AgentRpcHandlers:
         self._wake_word_enabled: bool = False
         self._wake_word_state: str = "disabled"  # "disabled", "listening", "active"
         self._wake_word_model: Optional[str] = None
+        # Serialized responses for the state polling RPCs, reset when their fields change
+        self._agent_state_response: Optional[str] = None
+        self._wake_word_response: Optional[str] = None
+        self._system_prompt_response: Optional[str] = None
+
+    def _state_changed(self):
+        """Drop the cached agent/wake word state responses after a field changes."""
+        self._agent_state_response = None
+        self._wake_word_response = None
 
     def set_model(self, model: str):
         """Set the current LLM model name."""
         self._current_model = model
+        self._state_changed()
 
     def set_stt_model(self, model: str):
         """Set the current STT model name."""
         self._stt_model = model
+        self._state_changed()
 
     def set_tts_provider(self, provider: str):
         """Set the current TTS provider."""
         self._tts_provider = provider
+        self._state_changed()
 
     def set_vad_settings(self, settings: dict):
         """Set the current VAD settings."""
-        self._vad_settings = settings
+        # Own a copy: _set_vad_settings updates it in place
+        self._vad_settings = dict(settings)
+        self._state_changed()
 
     def set_model_change_callback(self, callback: Callable[[str], None]):
         """Set callback for model changes."""
@@ -85,6 +160,7 @@ class AgentRpcHandlers:
     def set_mcp_servers(self, servers: list):
         """Set MCP servers for tool listing."""
         self._mcp_servers = servers
+        self._state_changed()
 
     def set_mcp_server_status(self, name: str, status: str, error: Optional[str] = None, tool_count: int = 0):
         """Update the status of a specific MCP server."""
@@ -93,11 +169,25 @@ class AgentRpcHandlers:
             "error": error,
             "tool_count": tool_count,
         }
+        self._mcp_server_fragments.pop(name, None)
 
     def set_mcp_change_callback(self, callback: Callable[[], Any]):
         """Set callback for MCP configuration changes (add/remove/toggle)."""
         self._on_mcp_change = callback
 
+    def set_tools_refresh_callback(self, callback: Callable[[Optional[str], bool], Any]):
+        """Set callback that refreshes expired tool caches before tools are listed."""
+        self._on_tools_requested = callback
+
+    async def _refresh_tools(self, server_name: Optional[str] = None, force: bool = False):
+        """Let the MCP manager re-fetch expired tool lists; serve the old cache on failure."""
+        if not self._on_tools_requested:
+            return
+        try:
+            await self._on_tools_requested(server_name, force)
+        except Exception as e:
+            logger.warning(f"Failed to refresh MCP tool cache: {e}")
+
     def set_vad_change_callback(self, callback: Callable[[dict], Any]):
         """Set callback for VAD settings changes."""
         self._on_vad_change = callback
@@ -111,25 +201,84 @@ class AgentRpcHandlers:
         return self._system_prompt
 
     def _load_config(self) -> dict:
-        """Load the entire config from persistent file."""
+        """
+        Load the entire config from persistent file.
+
+        Returns a deep copy of the cached config, so callers can't alter
+        (nested) cached values behind _save_config's back.
+        """
+        return copy.deepcopy(self._cached_config())
+
+    def _cached_config(self) -> dict:
+        """
+        The cached config dict, read from the file on first use only.
+
+        Never mutate it or hand it out - go through _save_config.
+        """
+        if self._config_cache is not None:
+            return self._config_cache
+        config = {}
         try:
             if AGENT_CONFIG_PATH.exists():
-                with open(AGENT_CONFIG_PATH, "r") as f:
-                    return json.load(f)
+                config = orjson.loads(AGENT_CONFIG_PATH.read_bytes())
         except Exception as e:
             logger.warning(f"Failed to load agent config: {e}")
-        return {}
+        self._config_cache = config
+        return config
 
     def _save_config(self, updates: dict):
-        """Save updates to the persistent config file."""
+        """
+        Apply updates to the cached config and schedule a write to disk.
+
+        The write happens CONFIG_FLUSH_DELAY seconds later in a worker
+        thread; updates arriving in the meantime are written together.
+        """
+        config = self._cached_config()
+        # UI re-sends of identical values (a slider snapping back, the same
+        # prompt saved twice) need no write at all
+        if all(k in config and config[k] == v for k, v in updates.items()):
+            return
+        self._config_cache = {**config, **updates}
+        self._config_dirty = True
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._deferred_flush(CONFIG_FLUSH_DELAY))
+        logger.info(f"Saved config updates: {list(updates.keys())}")
+
+    async def _deferred_flush(self, delay: float):
+        """Wait out a burst of updates, then write the config once."""
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self.flush_now()
+
+    async def flush_now(self):
+        """Write pending config updates to disk immediately (e.g. at shutdown)."""
+        async with self._flush_lock:
+            if not self._config_dirty:
+                return
+            self._config_dirty = False
+            try:
+                await asyncio.to_thread(self._write_config_sync, self._config_cache)
+            except Exception as e:
+                # Leave it dirty so the next flush retries
+                self._config_dirty = True
+                logger.error(f"Failed to save agent config: {e}")
+
+    @staticmethod
+    def _write_config_sync(config: dict):
+        """
+        Write the config to a temp file and atomically swap it into place.
+
+        A crash mid-write leaves the previous file intact. No fsync: losing
+        the very last settings change on power loss is acceptable here, and
+        the rename alone already rules out a truncated config.
+        """
+        tmp_path = AGENT_CONFIG_PATH.with_suffix(".json.tmp")
+        buf = orjson.dumps(config, option=orjson.OPT_INDENT_2)
         try:
-            config = self._load_config()
-            config.update(updates)
-            with open(AGENT_CONFIG_PATH, "w") as f:
-                json.dump(config, f, indent=2)
-            logger.info(f"Saved config updates: {list(updates.keys())}")
-        except Exception as e:
-            logger.error(f"Failed to save agent config: {e}")
+            tmp_path.write_bytes(buf)
+            os.replace(tmp_path, AGENT_CONFIG_PATH)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
             raise
 
     def _load_system_prompt(self) -> str:
@@ -150,112 +299,98 @@ class AgentRpcHandlers:
         """Save VAD settings to persistent config file."""
         self._save_config({"vad_settings": settings})
 
-    def set_mcp_tool_cache(self, cache: dict[str, list[dict]]):
-        """Set the MCP tool metadata cache (server_name -> list of tool dicts)."""
-        logger.info(f"[DEBUG] set_mcp_tool_cache called with keys: {list(cache.keys())}")
-        for name, tools in cache.items():
-            logger.info(f"[DEBUG] Cache '{name}': {len(tools)} tools")
-            if tools:
-                logger.info(f"[DEBUG] First tool in '{name}': {tools[0].get('name', 'unknown')}")
+    def set_mcp_tool_cache(self, cache: Mapping[str, list[dict]], version: Optional[int] = None):
+        """
+        Set the MCP tool metadata cache (server_name -> list of tool dicts).
+
+        The cache is treated as read-only. If `version` matches the one
+        already held, the cache is unchanged and the call is a no-op.
+        """
+        if version is not None and version == self._mcp_tool_cache_version:
+            return
+        self._mcp_tool_cache_version = version
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "MCP tool cache updated: %s",
+                {name: len(tools) for name, tools in cache.items()},
+            )
         self._mcp_tool_cache = cache
+        self._list_tools_response = None
+        self._mcp_tools_responses.clear()
 
     def set_wake_word_config(self, enabled: bool, model: Optional[str] = None):
         """Set wake word configuration."""
         self._wake_word_enabled = enabled
         self._wake_word_model = model
         self._wake_word_state = "listening" if enabled else "disabled"
+        self._state_changed()
 
     def set_wake_word_state(self, state: str):
         """Update wake word state."""
         self._wake_word_state = state
+        self._state_changed()
+
+    # RPC method name -> handler method; each handler takes RpcInvocationData
+    # and returns the JSON response string
+    RPC_TABLE = (
+        ("list_models", "_list_models"),
+        ("switch_model", "_switch_model"),
+        ("interrupt", "_interrupt"),
+        ("list_tools", "_list_tools"),
+        ("get_agent_state", "_get_agent_state"),
+        ("get_wake_word_state", "_get_wake_word_state"),
+        ("set_vad_settings", "_set_vad_settings"),
+        # System prompt RPC methods
+        ("get_system_prompt", "_get_system_prompt_rpc"),
+        ("set_system_prompt", "_set_system_prompt_rpc"),
+        # MCP management RPC methods
+        ("list_mcp_servers", "_list_mcp_servers"),
+        ("add_mcp_server", "_add_mcp_server"),
+        ("remove_mcp_server", "_remove_mcp_server"),
+        ("toggle_mcp_server", "_toggle_mcp_server"),
+        ("list_mcp_tools", "_list_mcp_tools"),
+        ("toggle_mcp_tool", "_toggle_mcp_tool"),
+    )
+    RPC_NAMES = ", ".join(rpc_name for rpc_name, _ in RPC_TABLE)
 
     async def register_all(self):
         """Register all RPC handlers on local participant."""
         local = self.room.local_participant
 
-        @local.register_rpc_method("list_models")
-        async def handle_list_models(data: RpcInvocationData) -> str:
-            return await self._list_models(data)
-
-        @local.register_rpc_method("switch_model")
-        async def handle_switch_model(data: RpcInvocationData) -> str:
-            return await self._switch_model(data)
-
-        @local.register_rpc_method("interrupt")
-        async def handle_interrupt(data: RpcInvocationData) -> str:
-            return await self._interrupt(data)
-
-        @local.register_rpc_method("list_tools")
-        async def handle_list_tools(data: RpcInvocationData) -> str:
-            return await self._list_tools(data)
-
-        @local.register_rpc_method("get_agent_state")
-        async def handle_get_state(data: RpcInvocationData) -> str:
-            return await self._get_agent_state(data)
-
-        @local.register_rpc_method("get_wake_word_state")
-        async def handle_get_wake_word_state(data: RpcInvocationData) -> str:
-            return await self._get_wake_word_state(data)
+        # Bound methods already match the handler signature, so no wrapper closures
+        for rpc_name, attr in self.RPC_TABLE:
+            local.register_rpc_method(rpc_name, getattr(self, attr))
 
-        @local.register_rpc_method("set_vad_settings")
-        async def handle_set_vad_settings(data: RpcInvocationData) -> str:
-            return await self._set_vad_settings(data)
-
-        # System prompt RPC methods
-        @local.register_rpc_method("get_system_prompt")
-        async def handle_get_system_prompt(data: RpcInvocationData) -> str:
-            return await self._get_system_prompt_rpc(data)
-
-        @local.register_rpc_method("set_system_prompt")
-        async def handle_set_system_prompt(data: RpcInvocationData) -> str:
-            return await self._set_system_prompt_rpc(data)
-
-        # MCP management RPC methods
-        @local.register_rpc_method("list_mcp_servers")
-        async def handle_list_mcp_servers(data: RpcInvocationData) -> str:
-            return await self._list_mcp_servers(data)
+        logger.info("Registered RPC handlers: %s", self.RPC_NAMES)
 
-        @local.register_rpc_method("add_mcp_server")
-        async def handle_add_mcp_server(data: RpcInvocationData) -> str:
-            return await self._add_mcp_server(data)
+    async def _get_models(self, max_age: float = MODELS_CACHE_TTL) -> list:
+        """Return Ollama's model list, reusing a listing younger than max_age seconds."""
+        now = time.monotonic()
+        if self._models_cache is not None and now - self._models_cache[0] < max_age:
+            return self._models_cache[1]
+        # Deferred so importing this module (and constructing the handlers) does
+        # not pull in the ollama client; most sessions never list models
+        from .ollama_client import get_ollama_client
 
-        @local.register_rpc_method("remove_mcp_server")
-        async def handle_remove_mcp_server(data: RpcInvocationData) -> str:
-            return await self._remove_mcp_server(data)
-
-        @local.register_rpc_method("toggle_mcp_server")
-        async def handle_toggle_mcp_server(data: RpcInvocationData) -> str:
-            return await self._toggle_mcp_server(data)
-
-        @local.register_rpc_method("list_mcp_tools")
-        async def handle_list_mcp_tools(data: RpcInvocationData) -> str:
-            return await self._list_mcp_tools(data)
-
-        @local.register_rpc_method("toggle_mcp_tool")
-        async def handle_toggle_mcp_tool(data: RpcInvocationData) -> str:
-            return await self._toggle_mcp_tool(data)
-
-        logger.info(
-            "Registered RPC handlers: list_models, switch_model, interrupt, list_tools, get_agent_state, "
-            "get_wake_word_state, set_vad_settings, list_mcp_servers, add_mcp_server, remove_mcp_server, "
-            "toggle_mcp_server, list_mcp_tools, toggle_mcp_tool"
-        )
+        client = get_ollama_client(self.ollama_host)
+        models_response = await client.list()
+        models = models_response.get("models", [])
+        self._models_cache = (now, models)
+        return models
 
     async def _list_models(self, data: RpcInvocationData) -> str:
         """List available Ollama models."""
         try:
-            client = ollama.AsyncClient(host=self.ollama_host)
-            models_response = await client.list()
             models = [
                 {
                     "name": m.get("name", m.get("model", "")),
                     "size": m.get("size", 0),
                     "modified_at": str(m.get("modified_at", "")),
                 }
-                for m in models_response.get("models", [])
+                for m in await self._get_models()
             ]
-            logger.info(f"Listed {len(models)} Ollama models")
-            return json.dumps(
+            logger.debug("Listed %d Ollama models", len(models))
+            return _dumps(
                 {
                     "success": True,
                     "models": models,
@@ -264,40 +399,34 @@ class AgentRpcHandlers:
             )
         except Exception as e:
             logger.error(f"Failed to list models: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     async def _switch_model(self, data: RpcInvocationData) -> str:
         """Switch to a different Ollama model."""
         try:
-            payload = json.loads(data.payload)
+            payload = _loads(data.payload)
             new_model = payload.get("model")
             if not new_model:
-                return json.dumps({"success": False, "error": "No model specified"})
+                return _error("No model specified")
 
             # Validate model exists
-            client = ollama.AsyncClient(host=self.ollama_host)
-            models_response = await client.list()
-            available = [
+            available = {
                 m.get("name", m.get("model", ""))
-                for m in models_response.get("models", [])
-            ]
+                for m in await self._get_models()
+            }
 
             if new_model not in available:
-                return json.dumps(
-                    {
-                        "success": False,
-                        "error": f"Model '{new_model}' not available. Available: {available}",
-                    }
-                )
+                return _error(f"Model '{new_model}' not available. Available: {sorted(available)}")
 
             old_model = self._current_model
             self._current_model = new_model
+            self._state_changed()
 
             if self._on_model_change:
                 self._on_model_change(new_model)
 
             logger.info(f"Switched model from {old_model} to {new_model}")
-            return json.dumps(
+            return _dumps(
                 {
                     "success": True,
                     "old_model": old_model,
@@ -306,7 +435,7 @@ class AgentRpcHandlers:
             )
         except Exception as e:
             logger.error(f"Failed to switch model: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     async def _interrupt(self, data: RpcInvocationData) -> str:
         """Interrupt current agent response."""
@@ -314,137 +443,138 @@ class AgentRpcHandlers:
             if self._on_interrupt:
                 self._on_interrupt()
             logger.info("Agent interrupted via RPC")
-            return json.dumps({"success": True, "message": "Interrupted"})
+            return _result(True, "Interrupted")
         except Exception as e:
             logger.error(f"Failed to interrupt: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     async def _list_tools(self, data: RpcInvocationData) -> str:
         """List all available MCP tools from cache."""
         try:
-            all_tools = []
-            for server_name, tools in self._mcp_tool_cache.items():
-                for tool in tools:
-                    all_tools.append({
+            payload = _loads(data.payload) if data.payload else {}
+            await self._refresh_tools(force=bool(payload.get("refresh")))
+
+            # The response only changes with the tool cache - build it once per cache
+            if self._list_tools_response is None:
+                all_tools = [
+                    {
                         "name": tool.get("name", "unknown"),
                         "description": tool.get("description", ""),
                         "server": server_name,
-                    })
-
-            logger.info(f"Listed {len(all_tools)} MCP tools")
-            return json.dumps({
-                "success": True,
-                "tools": all_tools,
-                "count": len(all_tools),
-            })
+                    }
+                    for server_name, tools in self._mcp_tool_cache.items()
+                    for tool in tools
+                ]
+                self._list_tools_response = _dumps({
+                    "success": True,
+                    "tools": all_tools,
+                    "count": len(all_tools),
+                })
+                logger.debug("Listed %d MCP tools", len(all_tools))
+            return self._list_tools_response
         except Exception as e:
             logger.error(f"Failed to list tools: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     async def _get_agent_state(self, data: RpcInvocationData) -> str:
         """Get current agent state."""
-        return json.dumps(
-            {
-                "success": True,
-                "llm_model": self._current_model,
-                "stt_model": self._stt_model,
-                "tts_provider": self._tts_provider,
-                "vad_settings": self._vad_settings,
-                "mcp_servers_count": len(self._mcp_servers),
-                "wake_word_enabled": self._wake_word_enabled,
-                "wake_word_state": self._wake_word_state,
-                "wake_word_model": self._wake_word_model,
-            }
-        )
+        if self._agent_state_response is None:
+            self._agent_state_response = _dumps(
+                {
+                    "success": True,
+                    "llm_model": self._current_model,
+                    "stt_model": self._stt_model,
+                    "tts_provider": self._tts_provider,
+                    "vad_settings": self._vad_settings,
+                    "mcp_servers_count": len(self._mcp_servers),
+                    "wake_word_enabled": self._wake_word_enabled,
+                    "wake_word_state": self._wake_word_state,
+                    "wake_word_model": self._wake_word_model,
+                }
+            )
+        return self._agent_state_response
 
     async def _get_wake_word_state(self, data: RpcInvocationData) -> str:
         """Get current wake word detection state."""
-        return json.dumps(
-            {
-                "success": True,
-                "enabled": self._wake_word_enabled,
-                "state": self._wake_word_state,
-                "model": self._wake_word_model,
-            }
-        )
+        if self._wake_word_response is None:
+            self._wake_word_response = _dumps(
+                {
+                    "success": True,
+                    "enabled": self._wake_word_enabled,
+                    "state": self._wake_word_state,
+                    "model": self._wake_word_model,
+                }
+            )
+        return self._wake_word_response
 
     async def _set_vad_settings(self, data: RpcInvocationData) -> str:
         """Update VAD settings."""
         try:
-            payload = json.loads(data.payload) if data.payload else {}
+            payload = _loads(data.payload) if data.payload else {}
 
             # Validate and extract settings
             new_settings = {}
-            if "activation_threshold" in payload:
-                val = float(payload["activation_threshold"])
-                if 0.0 <= val <= 1.0:
-                    new_settings["activation_threshold"] = val
-                else:
-                    return json.dumps({"success": False, "error": "activation_threshold must be between 0.0 and 1.0"})
-
-            if "min_speech_duration" in payload:
-                val = float(payload["min_speech_duration"])
-                if val >= 0:
-                    new_settings["min_speech_duration"] = val
-                else:
-                    return json.dumps({"success": False, "error": "min_speech_duration must be >= 0"})
-
-            if "min_silence_duration" in payload:
-                val = float(payload["min_silence_duration"])
-                if val >= 0:
-                    new_settings["min_silence_duration"] = val
-                else:
-                    return json.dumps({"success": False, "error": "min_silence_duration must be >= 0"})
+            for key, low, high, _ in VAD_SETTING_BOUNDS:
+                if key in payload:
+                    val = float(payload[key])
+                    if not low <= val <= high:
+                        return _VAD_RANGE_ERRORS[key]
+                    new_settings[key] = val
 
             if not new_settings:
-                return json.dumps({"success": False, "error": "No valid settings provided"})
+                return _NO_VAD_SETTINGS_ERROR
 
             # Update internal state
             if self._vad_settings:
                 self._vad_settings.update(new_settings)
             else:
                 self._vad_settings = new_settings
+            self._state_changed()
 
-            # Persist to config file
-            self._save_vad_settings(self._vad_settings)
+            # Persist to config file. Pass a snapshot: the write is deferred, and
+            # later updates mutate _vad_settings in place
+            self._save_vad_settings(dict(self._vad_settings))
 
             # Call callback if set
             if self._on_vad_change:
                 await self._on_vad_change(self._vad_settings)
 
             logger.info(f"Updated and persisted VAD settings: {new_settings}")
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "settings": self._vad_settings,
             })
         except Exception as e:
             logger.error(f"Failed to set VAD settings: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     # System Prompt RPC Methods
 
     async def _get_system_prompt_rpc(self, data: RpcInvocationData) -> str:
         """Get the current system prompt."""
         try:
-            return json.dumps({
-                "success": True,
-                "system_prompt": self._system_prompt,
-            })
+            if self._system_prompt_response is None:
+                self._system_prompt_response = _dumps({
+                    "success": True,
+                    "system_prompt": self._system_prompt,
+                })
+            return self._system_prompt_response
         except Exception as e:
             logger.error(f"Failed to get system prompt: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     async def _set_system_prompt_rpc(self, data: RpcInvocationData) -> str:
         """Set and persist the system prompt."""
         try:
-            payload = json.loads(data.payload) if data.payload else {}
+            payload = _loads(data.payload) if data.payload else {}
             new_prompt = payload.get("system_prompt", "").strip()
 
             if not new_prompt:
-                return json.dumps({"success": False, "error": "System prompt cannot be empty"})
+                return _error("System prompt cannot be empty")
 
             # Update internal state
             self._system_prompt = new_prompt
+            self._system_prompt_response = None
 
             # Persist to config file
             self._save_system_prompt(new_prompt)
@@ -454,85 +584,88 @@ class AgentRpcHandlers:
                 await self._on_system_prompt_change(new_prompt)
 
             logger.info(f"Updated system prompt (length: {len(new_prompt)} chars)")
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "system_prompt": new_prompt,
             })
         except Exception as e:
             logger.error(f"Failed to set system prompt: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     # MCP Management RPC Methods
 
+    @staticmethod
+    def _server_info(server_cfg, status_info: dict) -> dict:
+        """Build the list_mcp_servers entry for one server."""
+        server_info = {
+            "name": server_cfg.name,
+            "type": server_cfg.type,
+            "enabled": server_cfg.enabled,
+            "allowed_tools": server_cfg.allowed_tools,
+            # If disabled, override status
+            "status": status_info["status"] if server_cfg.enabled else "disabled",
+            "error": status_info.get("error"),
+            "tool_count": status_info.get("tool_count", 0),
+        }
+
+        # Add type-specific fields
+        if server_cfg.type == "http":
+            server_info["url"] = server_cfg.url
+            if server_cfg.headers:
+                server_info["headers"] = server_cfg.headers
+        else:  # stdio
+            server_info["command"] = server_cfg.command
+            if server_cfg.args:
+                server_info["args"] = server_cfg.args
+            if server_cfg.env:
+                server_info["env"] = server_cfg.env
+            if server_cfg.cwd:
+                server_info["cwd"] = server_cfg.cwd
+        return server_info
+
     async def _list_mcp_servers(self, data: RpcInvocationData) -> str:
         """List all configured MCP servers with status."""
         try:
-            config = mcp_config.load_config()
-            servers = []
+            # Only read here, so skip the defensive copy
+            config = mcp_config.load_config_readonly()
+            fragments = []
 
             for server_cfg in config.servers:
-                # Get status from tracked status or default to unknown
-                status_info = self._mcp_server_status.get(server_cfg.name, {
-                    "status": "unknown",
-                    "error": None,
-                    "tool_count": 0,
-                })
+                # Reuse the serialized entry while this exact config object is
+                # current; set_mcp_server_status drops it when the status changes
+                cached = self._mcp_server_fragments.get(server_cfg.name)
+                if cached is not None and cached[0] is server_cfg:
+                    fragments.append(cached[1])
+                    continue
 
-                # If disabled, override status
-                if not server_cfg.enabled:
-                    status_info["status"] = "disabled"
-
-                server_info = {
-                    "name": server_cfg.name,
-                    "type": server_cfg.type,
-                    "enabled": server_cfg.enabled,
-                    "allowed_tools": server_cfg.allowed_tools,
-                    "status": status_info["status"],
-                    "error": status_info.get("error"),
-                    "tool_count": status_info.get("tool_count", 0),
-                }
+                # Get status from tracked status or default to unknown
+                status_info = self._mcp_server_status.get(server_cfg.name, _UNKNOWN_SERVER_STATUS)
+                fragment = orjson.dumps(self._server_info(server_cfg, status_info))
+                self._mcp_server_fragments[server_cfg.name] = (server_cfg, fragment)
+                fragments.append(fragment)
 
-                # Add type-specific fields
-                if server_cfg.type == "http":
-                    server_info["url"] = server_cfg.url
-                    if server_cfg.headers:
-                        server_info["headers"] = server_cfg.headers
-                else:  # stdio
-                    server_info["command"] = server_cfg.command
-                    if server_cfg.args:
-                        server_info["args"] = server_cfg.args
-                    if server_cfg.env:
-                        server_info["env"] = server_cfg.env
-                    if server_cfg.cwd:
-                        server_info["cwd"] = server_cfg.cwd
-
-                servers.append(server_info)
-
-            logger.info(f"Listed {len(servers)} MCP server(s)")
-            return json.dumps({
-                "success": True,
-                "servers": servers,
-            })
+            logger.debug("Listed %d MCP server(s)", len(fragments))
+            return (b'{"success":true,"servers":[' + b",".join(fragments) + b"]}").decode()
         except Exception as e:
             logger.error(f"Failed to list MCP servers: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     async def _add_mcp_server(self, data: RpcInvocationData) -> str:
         """Add a new MCP server (HTTP or stdio)."""
         try:
-            payload = json.loads(data.payload) if data.payload else {}
+            payload = _loads(data.payload) if data.payload else {}
             name = payload.get("name")
             server_type = payload.get("type", "http")
             enabled = payload.get("enabled", True)
 
             if not name:
-                return json.dumps({"success": False, "error": "Server name is required"})
+                return _error("Server name is required")
 
             if server_type == "stdio":
                 # Stdio server: requires command
                 command = payload.get("command")
                 if not command:
-                    return json.dumps({"success": False, "error": "Command is required for stdio servers"})
+                    return _error("Command is required for stdio servers")
 
                 success, message = mcp_config.add_server(
                     name=name,
@@ -547,7 +680,7 @@ class AgentRpcHandlers:
                 # HTTP server: requires url
                 url = payload.get("url")
                 if not url:
-                    return json.dumps({"success": False, "error": "URL is required for HTTP servers"})
+                    return _error("URL is required for HTTP servers")
 
                 success, message = mcp_config.add_server(
                     name=name,
@@ -560,146 +693,149 @@ class AgentRpcHandlers:
             if success and self._on_mcp_change:
                 await self._on_mcp_change()
 
-            return json.dumps({"success": success, "message": message})
+            return _result(success, message)
         except Exception as e:
             logger.error(f"Failed to add MCP server: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     async def _remove_mcp_server(self, data: RpcInvocationData) -> str:
         """Remove an MCP server."""
         try:
-            payload = json.loads(data.payload) if data.payload else {}
+            payload = _loads(data.payload) if data.payload else {}
             name = payload.get("name")
 
             if not name:
-                return json.dumps({"success": False, "error": "Server name is required"})
+                return _error("Server name is required")
 
             success, message = mcp_config.remove_server(name)
 
             if success:
                 # Clean up status tracking
                 self._mcp_server_status.pop(name, None)
+                self._mcp_server_fragments.pop(name, None)
                 if self._on_mcp_change:
                     await self._on_mcp_change()
 
-            return json.dumps({"success": success, "message": message})
+            return _result(success, message)
         except Exception as e:
             logger.error(f"Failed to remove MCP server: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     async def _toggle_mcp_server(self, data: RpcInvocationData) -> str:
         """Toggle an MCP server on/off."""
         try:
-            payload = json.loads(data.payload) if data.payload else {}
+            payload = _loads(data.payload) if data.payload else {}
             name = payload.get("name")
             enabled = payload.get("enabled")  # Optional: if not provided, toggles
 
             if not name:
-                return json.dumps({"success": False, "error": "Server name is required"})
+                return _error("Server name is required")
 
             success, message = mcp_config.toggle_server(name, enabled)
 
             if success and self._on_mcp_change:
                 await self._on_mcp_change()
 
-            return json.dumps({"success": success, "message": message})
+            return _result(success, message)
         except Exception as e:
             logger.error(f"Failed to toggle MCP server: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     async def _list_mcp_tools(self, data: RpcInvocationData) -> str:
         """List tools for a specific MCP server using cached metadata."""
         try:
-            payload = json.loads(data.payload) if data.payload else {}
+            payload = _loads(data.payload) if data.payload else {}
             server_name = payload.get("name")
 
             if not server_name:
-                return json.dumps({"success": False, "error": "Server name is required"})
+                return _error("Server name is required")
 
             # Get server config for allowed_tools check
-            server_cfg = mcp_config.get_server(server_name)
+            server_cfg = mcp_config.get_server_readonly(server_name)
             if not server_cfg:
-                return json.dumps({"success": False, "error": f"Server '{server_name}' not found"})
-
-            # Debug: Log cache state
-            logger.info(f"[DEBUG] Tool cache keys: {list(self._mcp_tool_cache.keys())}")
-            logger.info(f"[DEBUG] Looking for server: '{server_name}'")
+                return _error(f"Server '{server_name}' not found")
 
             # Use cached tool metadata (fetched via MCP JSON-RPC)
+            await self._refresh_tools(server_name, force=bool(payload.get("refresh")))
             cached_tools = self._mcp_tool_cache.get(server_name, [])
-            logger.info(f"[DEBUG] Cached tools for '{server_name}': {len(cached_tools)} items")
-            if cached_tools:
-                logger.info(f"[DEBUG] First cached tool: {cached_tools[0]}")
 
-            tools = []
+            allowed = server_cfg.allowed_tools_set
+            cached_response = self._mcp_tools_responses.get(server_name)
+            if cached_response is not None and cached_response[0] == allowed:
+                return cached_response[1]
 
+            tools = []
             for tool in cached_tools:
                 tool_name = tool.get("name", "unknown")
                 # Check if tool is allowed
-                is_enabled = (
-                    server_cfg.allowed_tools is None or
-                    tool_name in server_cfg.allowed_tools
-                )
+                is_enabled = allowed is None or tool_name in allowed
                 tools.append({
                     "name": tool_name,
                     "description": tool.get("description", ""),
                     "enabled": is_enabled,
                 })
 
-            logger.info(f"Listed {len(tools)} tools for MCP server '{server_name}'")
-            return json.dumps({
+            logger.debug("Listed %d tools for MCP server '%s'", len(tools), server_name)
+            response = _dumps({
                 "success": True,
                 "server": server_name,
                 "tools": tools,
                 "count": len(tools),
             })
+            self._mcp_tools_responses[server_name] = (allowed, response)
+            return response
         except Exception as e:
             logger.error(f"Failed to list MCP tools: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
 
     async def _toggle_mcp_tool(self, data: RpcInvocationData) -> str:
         """Enable/disable a specific tool on an MCP server."""
         try:
-            payload = json.loads(data.payload) if data.payload else {}
+            payload = _loads(data.payload) if data.payload else {}
             server_name = payload.get("server")
             tool_name = payload.get("tool")
             enabled = payload.get("enabled")
 
             if not server_name:
-                return json.dumps({"success": False, "error": "Server name is required"})
+                return _error("Server name is required")
             if not tool_name:
-                return json.dumps({"success": False, "error": "Tool name is required"})
+                return _error("Tool name is required")
             if enabled is None:
-                return json.dumps({"success": False, "error": "Enabled state is required"})
+                return _error("Enabled state is required")
 
             # Get server config
-            server_cfg = mcp_config.get_server(server_name)
+            server_cfg = mcp_config.get_server_readonly(server_name)
             if not server_cfg:
-                return json.dumps({"success": False, "error": f"Server '{server_name}' not found"})
+                return _error(f"Server '{server_name}' not found")
 
-            # Calculate new allowed_tools list
+            # Calculate new allowed_tools list (membership via the set, order kept for persistence)
             current_allowed = server_cfg.allowed_tools
+            allowed = server_cfg.allowed_tools_set
 
             if enabled:
                 # Enable tool
-                if current_allowed is None:
-                    # All tools already allowed, nothing to do
-                    return json.dumps({"success": True, "message": f"Tool '{tool_name}' is already enabled"})
-                elif tool_name not in current_allowed:
-                    current_allowed.append(tool_name)
+                if allowed is None or tool_name in allowed:
+                    # Already allowed, nothing to do
+                    return _result(True, f"Tool '{tool_name}' is already enabled")
+                # server_cfg is the shared cached config - build a new list
+                current_allowed = current_allowed + [tool_name]
             else:
                 # Disable tool
-                if current_allowed is None:
+                if allowed is None:
                     # Get all tool names from cache and exclude this one
                     cached_tools = self._mcp_tool_cache.get(server_name, [])
-                    all_tool_names = [t.get("name", "") for t in cached_tools]
-                    current_allowed = [t for t in all_tool_names if t != tool_name]
+                    current_allowed = [
+                        name for name in (t.get("name", "") for t in cached_tools)
+                        if name != tool_name
+                    ]
+                elif tool_name not in allowed:
+                    return _result(True, f"Tool '{tool_name}' is already disabled")
                 else:
                     current_allowed = [t for t in current_allowed if t != tool_name]
 
             success, message = mcp_config.update_allowed_tools(server_name, current_allowed)
 
-            return json.dumps({"success": success, "message": message})
+            return _result(success, message)
         except Exception as e:
             logger.error(f"Failed to toggle MCP tool: {e}")
-            return json.dumps({"success": False, "error": str(e)})
+            return _error(str(e))
@@ -0,0 +1,280 @@
+"""Chunked streaming wrapper for non-streaming Whisper STT.
+
+LiveKit's StreamAdapter buffers a whole utterance and only transcribes once
+VAD reports end of speech, so Whisper's full runtime lands after the user
+stops talking. ChunkedWhisperSTT instead cuts the utterance into fixed-size
+windows while the user is still speaking and transcribes each one in the
+background. At end of speech only the trailing window is left to decode.
+
+Each window is prefixed with a short slice of the previous one so words on
+the boundary are not clipped; boundary words heard twice are dropped when the
+partial transcripts are merged. Disabled by default (STT_CHUNK_SECONDS=0).
+"""
+
+import asyncio
+import logging
+import math
+import re
+from collections.abc import AsyncIterable
+
+from livekit import rtc
+from livekit.agents import APIConnectOptions, utils
+from livekit.agents.stt import (
+    STT,
+    RecognizeStream,
+    SpeechData,
+    SpeechEvent,
+    SpeechEventType,
+    STTCapabilities,
+)
+from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, NotGivenOr
+from livekit.agents.utils import AudioBuffer
+from livekit.agents.vad import VAD, VADEventType
+
+logger = logging.getLogger("alexa-os.stt")
+
+_WORD_RE = re.compile(r"[^\w']+")
+
+# STT.recognize already retries each window, so the stream itself must not
+_STREAM_CONN_OPTIONS = APIConnectOptions(max_retry=0, timeout=DEFAULT_API_CONNECT_OPTIONS.timeout)
+
+
+def _frames_duration(frames: list[rtc.AudioFrame]) -> float:
+    """Total duration of a list of audio frames in seconds."""
+    return sum(f.samples_per_channel / f.sample_rate for f in frames)
+
+
+def _tail_frames(frames: list[rtc.AudioFrame], seconds: float) -> list[rtc.AudioFrame]:
+    """Return the trailing frames covering at least `seconds` of audio."""
+    tail: list[rtc.AudioFrame] = []
+    total = 0.0
+    for frame in reversed(frames):
+        if total >= seconds:
+            break
+        tail.append(frame)
+        total += frame.samples_per_channel / frame.sample_rate
+    tail.reverse()
+    return tail
+
+
+def _norm(word: str) -> str:
+    """Normalize a word for boundary comparison (case- and punctuation-insensitive)."""
+    return _WORD_RE.sub("", word).lower()
+
+
+def merge_transcripts(parts: list[tuple[str, float]], overlap_seconds: float) -> str:
+    """
+    Join chunk transcripts, dropping words repeated across chunk boundaries.
+
+    `parts` holds (text, window seconds) per chunk. Every window after the
+    first starts with `overlap_seconds` of the previous one, so its first
+    words may repeat the end of the previous chunk. Only as many words as
+    the window's speaking rate fits into the overlap are candidates, and a
+    match that continues a run of repeats already in the previous chunk
+    ("no no no" / "no I said stop") is kept, since a real repeat cannot be
+    told apart from a duplicate there. Otherwise the longest matching word
+    run is removed from the later chunk.
+    """
+    words: list[str] = []
+    for text, duration in parts:
+        new_words = text.split()
+        if not new_words:
+            continue
+        overlap_words = math.ceil(len(new_words) * overlap_seconds / duration) if duration > 0 else 0
+        limit = min(overlap_words, len(words), len(new_words))
+        for n in range(limit, 0, -1):
+            tail = [_norm(w) for w in words[-n:]]
+            head = [_norm(w) for w in new_words[:n]]
+            if tail != head:
+                continue
+            if [_norm(w) for w in words[-2 * n:-n]] != tail:
+                new_words = new_words[n:]
+            break
+        words.extend(new_words)
+    return " ".join(words)
+
+
+class ChunkedWhisperSTT(STT):
+    """
+    Streaming STT that transcribes VAD-delimited speech in rolling windows.
+
+    Drop-in replacement for StreamAdapter(stt=whisper, vad=vad).
+    """
+
+    def __init__(
+        self,
+        *,
+        stt: STT,
+        vad: VAD,
+        chunk_seconds: float = 2.0,
+        overlap_seconds: float = 0.5,
+    ):
+        """
+        Initialize the chunked STT wrapper.
+
+        Args:
+            stt: Non-streaming STT used to transcribe each window
+            vad: VAD used to detect start/end of speech
+            chunk_seconds: Audio length that triggers a background transcription
+            overlap_seconds: Trailing audio from the previous window prepended to the next
+        """
+        super().__init__(
+            capabilities=STTCapabilities(
+                streaming=True,
+                interim_results=False,
+            )
+        )
+        self._stt = stt
+        self._vad = vad
+        self._chunk_seconds = chunk_seconds
+        self._overlap_seconds = overlap_seconds
+
+    async def _recognize_impl(
+        self,
+        buffer: AudioBuffer,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions,
+    ) -> SpeechEvent:
+        return await self._stt.recognize(
+            buffer=buffer, language=language, conn_options=conn_options
+        )
+
+    def stream(
+        self,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> RecognizeStream:
+        return ChunkedRecognizeStream(
+            self,
+            language=language,
+            conn_options=conn_options,
+        )
+
+
+class ChunkedRecognizeStream(RecognizeStream):
+    """Recognize stream that overlaps Whisper decoding with user speech."""
+
+    def __init__(
+        self,
+        stt: ChunkedWhisperSTT,
+        *,
+        language: NotGivenOr[str],
+        conn_options: APIConnectOptions,
+    ):
+        super().__init__(stt=stt, conn_options=_STREAM_CONN_OPTIONS)
+        self._chunked = stt
+        self._language = language
+        self._recognize_conn_options = conn_options
+
+    async def _metrics_monitor_task(self, event_aiter: AsyncIterable[SpeechEvent]) -> None:
+        # Metrics are reported by the wrapped STT for each window
+        async for _ in event_aiter:
+            pass
+
+    async def _transcribe(self, frames: list[rtc.AudioFrame]) -> SpeechData | None:
+        """Transcribe one window, returning None on failure or silence."""
+        try:
+            event = await self._chunked._stt.recognize(
+                buffer=utils.merge_frames(frames),
+                language=self._language,
+                conn_options=self._recognize_conn_options,
+            )
+        except Exception as e:
+            logger.warning(f"Chunk transcription failed: {e}")
+            return None
+        if not event.alternatives or not event.alternatives[0].text.strip():
+            return None
+        return event.alternatives[0]
+
+    async def _run(self) -> None:
+        vad_stream = self._chunked._vad.stream()
+        chunk_seconds = self._chunked._chunk_seconds
+        overlap_seconds = self._chunked._overlap_seconds
+
+        async def _forward_input():
+            async for frame in self._input_ch:
+                if isinstance(frame, self._FlushSentinel):
+                    vad_stream.flush()
+                    continue
+                vad_stream.push_frame(frame)
+            vad_stream.end_input()
+
+        async def _recognize():
+            pending: list[rtc.AudioFrame] = []  # audio not yet sent to Whisper
+            context: list[rtc.AudioFrame] = []  # overlap carried into the next window
+            chunk_tasks: list[asyncio.Task[SpeechData | None]] = []
+            chunk_durations: list[float] = []
+            speaking = False
+
+            def cut_window():
+                nonlocal pending, context
+                window = context + pending
+                chunk_tasks.append(asyncio.create_task(self._transcribe(window)))
+                chunk_durations.append(_frames_duration(window))
+                context = _tail_frames(pending, overlap_seconds)
+                pending = []
+
+            async for event in vad_stream:
+                if event.type == VADEventType.START_OF_SPEECH:
+                    speaking = True
+                    pending = list(event.frames)
+                    context = []
+                    chunk_tasks = []
+                    chunk_durations = []
+                    self._event_ch.send_nowait(SpeechEvent(type=SpeechEventType.START_OF_SPEECH))
+
+                elif event.type == VADEventType.INFERENCE_DONE and speaking:
+                    pending.extend(event.frames)
+                    if _frames_duration(pending) >= chunk_seconds:
+                        cut_window()
+
+                elif event.type == VADEventType.END_OF_SPEECH:
+                    speaking = False
+                    self._event_ch.send_nowait(SpeechEvent(type=SpeechEventType.END_OF_SPEECH))
+
+                    if pending or not chunk_tasks:
+                        # Only the trailing audio is left to decode
+                        if not chunk_tasks:
+                            pending = list(event.frames)
+                        cut_window()
+
+                    results = await asyncio.gather(*chunk_tasks)
+                    windows = [
+                        (p, duration)
+                        for p, duration in zip(results, chunk_durations)
+                        if p is not None
+                    ]
+                    chunk_tasks = []
+                    chunk_durations = []
+                    if not windows:
+                        continue
+
+                    parts = [p for p, _ in windows]
+                    transcript = merge_transcripts(
+                        [(p.text.strip(), duration) for p, duration in windows],
+                        overlap_seconds,
+                    )
+                    self._event_ch.send_nowait(
+                        SpeechEvent(
+                            type=SpeechEventType.FINAL_TRANSCRIPT,
+                            alternatives=[
+                                SpeechData(
+                                    text=transcript,
+                                    language=parts[0].language,
+                                    confidence=min(p.confidence for p in parts),
+                                )
+                            ],
+                        )
+                    )
+
+        tasks = [
+            asyncio.create_task(_forward_input(), name="forward_input"),
+            asyncio.create_task(_recognize(), name="recognize"),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await utils.aio.cancel_and_wait(*tasks)
+            await vad_stream.aclose()
@@ -0,0 +1,285 @@
+"""Local Whisper STT implementation using ONNX Runtime.
+
+Runs Whisper as three ONNX graphs exported with fused multi-head attention
+(e.g. via `onnxruntime.transformers.optimizer --use_multi_head_attention`
+or `optimum-cli export onnx`):
+
+- encoder_model.onnx: log-mel features -> encoder hidden states
+- decoder_model.onnx: prompt tokens + hidden states -> logits, initial KV cache
+- decoder_with_past_model.onnx: one token + KV cache -> logits, updated KV cache
+
+Each graph can be quantized independently. The decoder KV cache is kept as
+OrtValues bound through IOBinding, so it never round-trips through numpy
+between decoding steps.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from livekit.agents.stt import (
+    STT,
+    SpeechEvent,
+    SpeechEventType,
+    SpeechData,
+    STTCapabilities,
+)
+from livekit.agents.utils import AudioBuffer
+from livekit.agents import APIConnectOptions
+
+from .audio import pcm16_to_float32
+from .config import inference_threads
+
+logger = logging.getLogger("alexa-os.stt")
+
+ENCODER_FILE = "encoder_model.onnx"
+DECODER_FILE = "decoder_model.onnx"
+DECODER_WITH_PAST_FILE = "decoder_with_past_model.onnx"
+
+# Dynamic axes pinned per graph (optimum export names). The processor always
+# pads features to 30s (3000 mel frames), we decode one utterance at a time,
+# and the with-past decoder always sees a single new token. Fixing these lets
+# ORT resolve shapes once at load time and plan memory ahead of the first run.
+ENCODER_STATIC_DIMS = {"batch_size": 1, "encoder_sequence_length": 3000}
+DECODER_STATIC_DIMS = {"batch_size": 1}
+DECODER_WITH_PAST_STATIC_DIMS = {"batch_size": 1, "decoder_sequence_length": 1}
+
+
+class OnnxWhisperSTT(STT):
+    """
+    Local Speech-to-Text using Whisper exported to ONNX Runtime.
+
+    This is a non-streaming STT - use with StreamAdapter + VAD for real-time use.
+    Decoding is greedy (no beam search), which is what a short voice command needs.
+
+    The model directory must contain the three ONNX graphs plus the Whisper
+    processor files (preprocessor_config.json, tokenizer files).
+    """
+
+    def __init__(
+        self,
+        model_dir: str,
+        device: str = "auto",
+        language: str = "en",
+        max_new_tokens: int = 224,
+        static_shapes: bool = True,
+    ):
+        """
+        Initialize the ONNX Whisper STT.
+
+        Args:
+            model_dir: Directory containing the exported ONNX graphs and processor files
+            device: Device to use ("auto", "cpu", "cuda")
+            language: Target language code
+            max_new_tokens: Upper bound on decoded tokens per utterance
+            static_shapes: Pin batch/sequence dimensions to their fixed values at load time
+        """
+        super().__init__(
+            capabilities=STTCapabilities(
+                streaming=False,
+                interim_results=False,
+            )
+        )
+
+        self._model_dir = Path(model_dir)
+        self._device = device
+        self._language = language
+        self._max_new_tokens = max_new_tokens
+        self._static_shapes = static_shapes
+
+        self._encoder = None
+        self._decoder = None
+        self._decoder_with_past = None
+        self._processor = None
+        self._ort_device = "cpu"
+        self._past_names: list[str] = []
+        self._needs_hidden = False
+        self._prompt_cache: dict[str, list[int]] = {}
+        # Decoding runs here, off the event loop
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        logger.info(f"Initializing OnnxWhisperSTT from: {model_dir}")
+
+    def _ensure_model_loaded(self) -> None:
+        """Lazy load the ONNX sessions on first use."""
+        if self._encoder is not None:
+            return
+
+        import onnxruntime as ort
+        from transformers import WhisperProcessor
+
+        use_cuda = self._device in ("auto", "cuda") and (
+            "CUDAExecutionProvider" in ort.get_available_providers()
+        )
+        if use_cuda:
+            providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+            self._ort_device = "cuda"
+        else:
+            providers = ["CPUExecutionProvider"]
+            self._ort_device = "cpu"
+
+        def load(filename: str, dimension_overrides: dict[str, int]):
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+            options.enable_cpu_mem_arena = True
+            if not use_cuda:
+                options.intra_op_num_threads = inference_threads()
+            if self._static_shapes:
+                for name, value in dimension_overrides.items():
+                    options.add_free_dimension_override_by_name(name, value)
+            return ort.InferenceSession(
+                str(self._model_dir / filename),
+                sess_options=options,
+                providers=providers,
+            )
+
+        logger.info(
+            f"Loading ONNX Whisper graphs (providers={providers}, "
+            f"static_shapes={self._static_shapes})"
+        )
+        self._encoder = load(ENCODER_FILE, ENCODER_STATIC_DIMS)
+        self._decoder = load(DECODER_FILE, DECODER_STATIC_DIMS)
+        self._decoder_with_past = load(DECODER_WITH_PAST_FILE, DECODER_WITH_PAST_STATIC_DIMS)
+        self._processor = WhisperProcessor.from_pretrained(str(self._model_dir))
+
+        self._past_names = [
+            i.name for i in self._decoder_with_past.get_inputs()
+            if i.name.startswith("past_key_values.")
+        ]
+        # Some exports also feed encoder states to every with-past step
+        self._needs_hidden = any(
+            i.name == "encoder_hidden_states" for i in self._decoder_with_past.get_inputs()
+        )
+        logger.info("ONNX Whisper graphs loaded successfully")
+
+    def warmup(self) -> None:
+        """
+        Load the sessions and decode 1s of silence.
+
+        Blocking - call via asyncio.to_thread().
+        """
+        self._transcribe(np.zeros(16000, dtype=np.float32), self._language)
+        logger.info("ONNX Whisper model warmed up")
+
+    def _prompt_ids(self, language: str) -> list[int]:
+        """Build (and cache) the decoder prompt for a language."""
+        if language not in self._prompt_cache:
+            tokenizer = self._processor.tokenizer
+            sot = tokenizer.convert_tokens_to_ids("<|startoftranscript|>")
+            forced = self._processor.get_decoder_prompt_ids(language=language, task="transcribe")
+            self._prompt_cache[language] = [sot] + [token_id for _, token_id in forced]
+        return self._prompt_cache[language]
+
+    def _run(self, session, inputs: dict) -> dict:
+        """Run a session via IOBinding, keeping outputs as device-resident OrtValues."""
+        binding = session.io_binding()
+        for name, value in inputs.items():
+            if isinstance(value, np.ndarray):
+                binding.bind_cpu_input(name, value)
+            else:
+                binding.bind_ortvalue_input(name, value)
+        output_names = [o.name for o in session.get_outputs()]
+        for name in output_names:
+            binding.bind_output(name, self._ort_device)
+        session.run_with_iobinding(binding)
+        return dict(zip(output_names, binding.get_outputs()))
+
+    def _transcribe(self, audio: np.ndarray, language: str) -> str:
+        """Greedy-decode a float32 16kHz waveform into text."""
+        self._ensure_model_loaded()
+
+        features = self._processor(
+            audio, sampling_rate=16000, return_tensors="np"
+        ).input_features.astype(np.float32)
+        hidden = self._run(self._encoder, {"input_features": features})["last_hidden_state"]
+
+        outputs = self._run(self._decoder, {
+            "input_ids": np.array([self._prompt_ids(language)], dtype=np.int64),
+            "encoder_hidden_states": hidden,
+        })
+        # present.N.{decoder,encoder}.{key,value} -> past_key_values.N...
+        past = {
+            name.replace("present", "past_key_values", 1): value
+            for name, value in outputs.items()
+            if name.startswith("present.")
+        }
+
+        eos = self._processor.tokenizer.eos_token_id
+        generated: list[int] = []
+        next_token = int(outputs["logits"].numpy()[0, -1].argmax())
+
+        while next_token != eos and len(generated) < self._max_new_tokens:
+            generated.append(next_token)
+
+            inputs = {"input_ids": np.array([[next_token]], dtype=np.int64)}
+            if self._needs_hidden:
+                inputs["encoder_hidden_states"] = hidden
+            for name in self._past_names:
+                inputs[name] = past[name]
+
+            outputs = self._run(self._decoder_with_past, inputs)
+            # Only decoder self-attention KV is updated; encoder KV stays from init
+            for name, value in outputs.items():
+                if name.startswith("present."):
+                    past[name.replace("present", "past_key_values", 1)] = value
+            next_token = int(outputs["logits"].numpy()[0, -1].argmax())
+
+        return self._processor.tokenizer.decode(generated, skip_special_tokens=True).strip()
+
+    async def _recognize_impl(
+        self,
+        buffer: AudioBuffer,
+        *,
+        language: str | None = None,
+        conn_options: APIConnectOptions,
+    ) -> SpeechEvent:
+        """
+        Transcribe audio buffer using ONNX Whisper.
+
+        Args:
+            buffer: Audio buffer containing PCM audio data
+            language: Optional language override
+            conn_options: Connection options (unused for local inference)
+
+        Returns:
+            SpeechEvent containing transcription results
+        """
+        lang = language or self._language
+
+        audio_array = pcm16_to_float32(buffer.data)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="onnx-whisper")
+        transcript = await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._transcribe, audio_array, lang
+        )
+
+        logger.debug(f"Transcribed (onnx): '{transcript}'")
+
+        return SpeechEvent(
+            type=SpeechEventType.FINAL_TRANSCRIPT,
+            alternatives=[
+                SpeechData(
+                    text=transcript,
+                    language=lang,
+                    confidence=1.0,
+                )
+            ],
+        )
+
+    async def aclose(self) -> None:
+        """Release ONNX sessions."""
+        if self._encoder is not None:
+            self._encoder = None
+            self._decoder = None
+            self._decoder_with_past = None
+            self._processor = None
+            logger.info("ONNX Whisper model unloaded")
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -1,7 +1,10 @@
 """Local Whisper STT implementation using faster-whisper."""
 
+import asyncio
+import functools
 import logging
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from faster_whisper import WhisperModel
 
@@ -15,9 +18,80 @@ from livekit.agents.stt import (
 from livekit.agents.utils import AudioBuffer
 from livekit.agents import APIConnectOptions
 
+from .audio import pcm16_to_float32
+from .config import inference_threads
+
 logger = logging.getLogger("alexa-os.stt")
 
 
+def resolve_device(device: str) -> str:
+    """
+    Map a configured device onto one CTranslate2 accepts.
+
+    CTranslate2 has no Metal/MPS backend - on Apple Silicon it runs on the
+    CPU (INT8 GEMM through Accelerate/Ruy), so "mps" becomes "cpu".
+    """
+    if device == "mps":
+        return "cpu"
+    return device
+
+
+@functools.lru_cache(maxsize=None)
+def _uses_cuda(device: str) -> bool:
+    """Whether CTranslate2 will run on CUDA for a configured device (probed once)."""
+    if device != "auto":
+        return device == "cuda"
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _supported_compute_types(device: str) -> frozenset[str]:
+    """Compute types CTranslate2 has kernels for on this machine's CPU ISA / GPU."""
+    try:
+        import ctranslate2
+        return frozenset(ctranslate2.get_supported_compute_types(device))
+    except Exception:
+        return frozenset()
+
+
+def resolve_compute_type(device: str, compute_type: str) -> str:
+    """
+    Resolve "auto" to a quantized CTranslate2 compute type.
+
+    Prefers int8_float16 when running on CUDA and int8 everywhere else,
+    falling back to the fastest type CTranslate2 reports as supported by the
+    GPU or CPU instruction set. Explicit compute types are passed through unchanged.
+    """
+    if compute_type != "auto":
+        return compute_type
+    if _uses_cuda(device):
+        ct2_device, preferred = "cuda", ("int8_float16", "float16", "int8", "float32")
+    else:
+        ct2_device, preferred = "cpu", ("int8", "float32")
+    supported = _supported_compute_types(ct2_device)
+    resolved = next((c for c in preferred if c in supported), preferred[0])
+    logger.info(f"Whisper compute type: {resolved} on {ct2_device} (supported: {sorted(supported)})")
+    return resolved
+
+
+def resolve_model(model: str, device: str) -> str:
+    """
+    Resolve "auto" to a distil-whisper model for the device.
+
+    distil-small.en on CPU, distil-large-v3 on CUDA: both keep the full
+    encoder but only two decoder layers, so each decoded token is much
+    cheaper than with the original checkpoints at similar WER.
+    Explicit model names are passed through unchanged.
+    """
+    if model != "auto":
+        return model
+    return "distil-large-v3" if _uses_cuda(resolve_device(device)) else "distil-small.en"
+
+
 class FasterWhisperSTT(STT):
     """
     Local Speech-to-Text using faster-whisper (CTranslate2-based Whisper).
@@ -30,9 +104,10 @@ class FasterWhisperSTT(STT):
     - small, small.en (244M params)
     - medium, medium.en (769M params)
     - large-v2, large-v3 (1550M params)
-    - distil-large-v3 (756M params, faster)
+    - distil-small.en (166M params), distil-large-v3 (756M params) - faster decoders
 
-    For Apple Silicon, use compute_type="auto" to leverage Metal acceleration.
+    compute_type="auto" resolves to a quantized type (int8_float16 on CUDA,
+    int8 on CPU), which roughly halves weight bandwidth with no WER loss.
     """
 
     def __init__(
@@ -42,6 +117,9 @@ class FasterWhisperSTT(STT):
         compute_type: str = "auto",
         language: str = "en",
         download_root: Optional[str] = None,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        beam_size: int = 1,
     ):
         """
         Initialize the Whisper STT.
@@ -49,9 +127,12 @@ class FasterWhisperSTT(STT):
         Args:
             model: Whisper model size (tiny, base, small, medium, large-v3, etc.)
             device: Device to use ("auto", "cpu", "cuda", "mps")
-            compute_type: Quantization ("auto", "int8", "float16", "float32")
+            compute_type: Quantization ("auto", "int8", "int8_float16", "float16", "float32")
             language: Target language code
             download_root: Directory to store downloaded models
+            cpu_threads: CTranslate2 intra-op threads on CPU (0 = inference_threads())
+            num_workers: Number of parallel transcriptions the model can serve
+            beam_size: Decoder beam width (1 = greedy)
         """
         super().__init__(
             capabilities=STTCapabilities(
@@ -61,13 +142,23 @@ class FasterWhisperSTT(STT):
         )
 
         self._model_name = model
-        self._device = device
-        self._compute_type = compute_type
+        self._device = resolve_device(device)
+        self._compute_type = resolve_compute_type(self._device, compute_type)
         self._language = language
         self._download_root = download_root
+        self._cpu_threads = cpu_threads or inference_threads()
+        self._num_workers = num_workers
+        self._beam_size = beam_size
         self._model: Optional[WhisperModel] = None
+        # Reusable float32 conversion buffers, one per in-flight transcription
+        self._scratch: list[np.ndarray] = []
+        # Transcriptions run here, off the event loop (one thread per model worker)
+        self._executor: Optional[ThreadPoolExecutor] = None
 
-        logger.info(f"Initializing FasterWhisperSTT with model: {model}")
+        logger.info(
+            f"Initializing FasterWhisperSTT with model: {model} "
+            f"(device={self._device}, compute_type={self._compute_type})"
+        )
 
     def _ensure_model_loaded(self) -> WhisperModel:
         """Lazy load the model on first use."""
@@ -78,10 +169,28 @@ class FasterWhisperSTT(STT):
                 device=self._device,
                 compute_type=self._compute_type,
                 download_root=self._download_root,
+                cpu_threads=self._cpu_threads,
+                num_workers=self._num_workers,
             )
             logger.info(f"Whisper model loaded successfully")
         return self._model
 
+    def warmup(self) -> None:
+        """
+        Load the model and run one transcription over 1s of silence.
+
+        Blocking - call via asyncio.to_thread(). Avoids paying model load and
+        first-inference allocation cost on the user's first utterance.
+        """
+        model = self._ensure_model_loaded()
+        silence = np.zeros(16000, dtype=np.float32)
+        segments, _ = model.transcribe(
+            silence, language=self._language, beam_size=self._beam_size, without_timestamps=True
+        )
+        for _ in segments:
+            pass
+        logger.info("Whisper model warmed up")
+
     async def _recognize_impl(
         self,
         buffer: AudioBuffer,
@@ -100,35 +209,55 @@ class FasterWhisperSTT(STT):
         Returns:
             SpeechEvent containing transcription results
         """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._num_workers, thread_name_prefix="whisper"
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._recognize_sync, buffer.data, language or self._language
+        )
+
+    def _recognize_sync(self, audio_data, lang: str) -> SpeechEvent:
+        """Blocking part of _recognize_impl, run on the STT executor."""
         model = self._ensure_model_loaded()
-        lang = language or self._language
 
         # Convert audio buffer to numpy array
         # AudioBuffer provides audio as int16 PCM at 16kHz
-        audio_data = buffer.data
-        if isinstance(audio_data, bytes):
-            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-        else:
-            audio_array = np.array(audio_data, dtype=np.float32)
-            if audio_array.max() > 1.0:
-                audio_array = audio_array / 32768.0
+        scratch = self._acquire_scratch(len(audio_data))
+        try:
+            return self._transcribe(model, pcm16_to_float32(audio_data, out=scratch), lang)
+        finally:
+            self._scratch.append(scratch)
 
+    def _acquire_scratch(self, samples: int) -> np.ndarray:
+        """Take a free conversion buffer, growing it if it can't hold `samples`."""
+        scratch = self._scratch.pop() if self._scratch else None
+        if scratch is None or scratch.size < samples:
+            scratch = np.empty(samples, dtype=np.float32)
+        return scratch
+
+    def _transcribe(self, model: WhisperModel, audio_array: np.ndarray, lang: str) -> SpeechEvent:
+        """Run Whisper over float32 16kHz audio and build the final transcript event."""
         # Run transcription
         # NOTE: vad_filter=False because we already use Silero VAD via StreamAdapter
         # Double VAD filtering can cause audio quality issues
         segments, info = model.transcribe(
             audio_array,
             language=lang,
-            beam_size=5,
+            beam_size=self._beam_size,
+            # Only the text is used, so skip predicting timestamp tokens
+            without_timestamps=True,
             vad_filter=False,
+            # No temperature fallback: a low-confidence segment is kept rather
+            # than re-decoded at higher temperatures (faster-whisper's main tail latency)
+            temperature=0.0,
+            # Utterances are short commands - don't feed each segment's text
+            # back in as the next segment's decoder prompt
+            condition_on_previous_text=False,
         )
 
-        # Collect all segments into final transcript
-        transcript_parts = []
-        for segment in segments:
-            transcript_parts.append(segment.text.strip())
-
-        transcript = " ".join(transcript_parts).strip()
+        # Collect all segments into final transcript as they are decoded
+        transcript = " ".join(segment.text.strip() for segment in segments).strip()
 
         logger.debug(f"Transcribed: '{transcript}' (language: {info.language}, prob: {info.language_probability:.2f})")
 
@@ -150,3 +279,6 @@ class FasterWhisperSTT(STT):
             # faster-whisper doesn't have explicit cleanup, but we can dereference
             self._model = None
             logger.info("Whisper model unloaded")
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -1,15 +1,38 @@
 """Telemetry emitter for agent observability."""
 
-import json
+import asyncio
 import logging
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import time
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Awaitable, Optional
+
+import orjson
 from livekit.rtc import Room
 
 logger = logging.getLogger("alexa-os")
 
+# LLM response chunks are coalesced into one event per window (or per batch of chunks)
+LLM_CHUNK_FLUSH_DELAY = 0.05
+LLM_CHUNK_MAX_PENDING = 8
+
+# (whole second, its local ISO 8601 prefix) reused by every event in that second
+_iso_second: tuple[int, str] = (0, "")
+
+
+def _iso_timestamp() -> str:
+    """
+    Local-time ISO 8601 timestamp with microseconds, like datetime.now().isoformat().
+
+    Only the sub-second part is formatted per call; the date/time prefix is
+    rebuilt once per second.
+    """
+    global _iso_second
+    now = time.time()
+    second = int(now)
+    if second != _iso_second[0]:
+        _iso_second = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second)))
+    return f"{_iso_second[1]}.{int((now - second) * 1_000_000):06d}"
+
 
 class TelemetryEventType(str, Enum):
     LLM_REQUEST_START = "llm_request_start"
@@ -24,14 +47,6 @@ class TelemetryEventType(str, Enum):
     ERROR = "error"
 
 
-@dataclass
-class TelemetryEvent:
-    type: TelemetryEventType
-    timestamp: str
-    data: dict
-    request_id: Optional[str] = None
-
-
 class TelemetryEmitter:
     """Emits telemetry events to UI via LiveKit data channel."""
 
@@ -41,11 +56,72 @@ class TelemetryEmitter:
         self.room = room
         self._enabled = True
         self._request_counter = 0
+        # Events queued from sync callbacks, published in order by one consumer task
+        self._queue: asyncio.Queue[Awaitable[Any]] = asyncio.Queue()
+        self._consumer_task: Optional[asyncio.Task] = None
+        # LLM chunks waiting to be emitted, and their flush timers, per request_id
+        self._chunk_buffer: dict[str, list[str]] = {}
+        self._chunk_timers: dict[str, asyncio.TimerHandle] = {}
+
+    def start(self):
+        """Start the consumer task that publishes queued events."""
+        if self._consumer_task is None:
+            self._consumer_task = asyncio.create_task(self._consume())
+
+    async def stop(self):
+        """Stop the consumer task, dropping any events still queued."""
+        if self._consumer_task is not None:
+            self._consumer_task.cancel()
+            try:
+                await self._consumer_task
+            except asyncio.CancelledError:
+                pass
+            self._consumer_task = None
+
+        for timer in self._chunk_timers.values():
+            timer.cancel()
+        self._chunk_timers.clear()
+        self._chunk_buffer.clear()
+
+        while not self._queue.empty():
+            coro = self._queue.get_nowait()
+            if hasattr(coro, "close"):
+                coro.close()
+
+    def submit(self, coro: Awaitable[Any]):
+        """
+        Queue a telemetry coroutine from a sync event handler.
+
+        Cheaper than asyncio.create_task() per event, and keeps events in order.
+        Dropped straight away when nobody could receive it.
+        """
+        if not self._has_subscribers():
+            if hasattr(coro, "close"):
+                coro.close()
+            return
+        self._queue.put_nowait(coro)
+
+    def submit_state_change(self, new_state: str):
+        """Queue an agent state change event."""
+        self.submit(self.agent_state_change(new_state))
+
+    async def _consume(self):
+        """Publish queued telemetry events one at a time."""
+        while True:
+            coro = await self._queue.get()
+            try:
+                await coro
+            except Exception as e:
+                logger.warning(f"Failed to emit queued telemetry: {e}")
+
+    def _has_subscribers(self) -> bool:
+        """Whether telemetry is enabled and a remote participant (the UI) is in the room."""
+        return self._enabled and bool(self.room.remote_participants)
 
     def generate_request_id(self) -> str:
         """Generate unique request ID."""
         self._request_counter += 1
-        return f"req_{self._request_counter}_{int(datetime.now().timestamp() * 1000)}"
+        return f"req_{self._request_counter}_{time.time_ns() // 1_000_000}"
 
     async def emit(
         self,
@@ -54,21 +130,17 @@ class TelemetryEmitter:
         request_id: Optional[str] = None,
     ):
         """Emit a telemetry event to all participants."""
-        if not self._enabled:
+        # Headless runs: skip encoding and publishing events no one can read
+        if not self._has_subscribers():
             return
 
-        event = TelemetryEvent(
-            type=event_type,
-            timestamp=datetime.now().isoformat(),
-            data=data,
-            request_id=request_id,
-        )
-
         try:
-            # Convert enum to string for JSON serialization
-            event_dict = asdict(event)
-            event_dict["type"] = event_type.value
-            payload = json.dumps(event_dict).encode("utf-8")
+            payload = orjson.dumps({
+                "type": event_type.value,
+                "timestamp": _iso_timestamp(),
+                "data": data,
+                "request_id": request_id,
+            }, option=orjson.OPT_NON_STR_KEYS)
 
             await self.room.local_participant.publish_data(
                 payload=payload,
@@ -90,17 +162,47 @@ class TelemetryEmitter:
         return request_id
 
     async def llm_chunk(self, request_id: str, chunk: str):
-        """Emit LLM response chunk."""
-        await self.emit(
-            TelemetryEventType.LLM_CHUNK,
-            {"chunk": chunk},
-            request_id,
-        )
+        """
+        Buffer an LLM response chunk.
+
+        Chunks are joined into one LLM_CHUNK event per LLM_CHUNK_FLUSH_DELAY
+        window (or every LLM_CHUNK_MAX_PENDING chunks) instead of one data
+        message per token.
+        """
+        if not self._has_subscribers():
+            return
+        pending = self._chunk_buffer.setdefault(request_id, [])
+        pending.append(chunk)
+        if len(pending) >= LLM_CHUNK_MAX_PENDING:
+            await self._flush_chunks(request_id)
+        elif request_id not in self._chunk_timers:
+            self._chunk_timers[request_id] = asyncio.get_running_loop().call_later(
+                LLM_CHUNK_FLUSH_DELAY, self._on_chunk_timer, request_id
+            )
+
+    def _on_chunk_timer(self, request_id: str):
+        """Queue the flush of a request's buffered chunks once its window ends."""
+        self._chunk_timers.pop(request_id, None)
+        self.submit(self._flush_chunks(request_id))
+
+    async def _flush_chunks(self, request_id: str):
+        """Emit a request's buffered chunks as a single LLM_CHUNK event."""
+        timer = self._chunk_timers.pop(request_id, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._chunk_buffer.pop(request_id, None)
+        if pending:
+            await self.emit(
+                TelemetryEventType.LLM_CHUNK,
+                {"chunk": "".join(pending)},
+                request_id,
+            )
 
     async def llm_request_end(
         self, request_id: str, total_tokens: Optional[int] = None
     ):
-        """Emit LLM request end event."""
+        """Emit LLM request end event, after any chunks still buffered."""
+        await self._flush_chunks(request_id)
         await self.emit(
             TelemetryEventType.LLM_REQUEST_END,
             {"total_tokens": total_tokens},
@@ -1,31 +1,75 @@
 """Voice pipeline component factories for STT, TTS, VAD, and LLM."""
 
+import functools
 import logging
+import os
 from livekit.agents.stt import StreamAdapter
 from livekit.plugins import silero, openai as openai_plugin
 
 from .config import settings
-from .stt_whisper import FasterWhisperSTT
+from .stt_chunked import ChunkedWhisperSTT
+from .stt_whisper import FasterWhisperSTT, resolve_model
 from .wake_word import WakeWordDetector
 
 logger = logging.getLogger("alexa-os")
 
 
 def create_stt():
-    """Create local Whisper STT instance."""
-    logger.info(f"Creating local Whisper STT: model={settings.whisper_model}")
+    """Create local Whisper STT instance (CTranslate2 or ONNX Runtime backend)."""
+    model = resolve_model(settings.whisper_model, settings.whisper_device)
+    if settings.stt_backend == "onnx":
+        from .stt_onnx import OnnxWhisperSTT
+
+        model_dir = settings.whisper_onnx_dir or os.path.join(
+            settings.model_cache_dir, "whisper-onnx", model
+        )
+        logger.info(f"Creating ONNX Whisper STT: model_dir={model_dir}")
+
+        return OnnxWhisperSTT(
+            model_dir=model_dir,
+            device=settings.whisper_device,
+            language=settings.whisper_language,
+            static_shapes=settings.whisper_onnx_static_shapes,
+        )
+    elif settings.stt_backend != "ctranslate2":
+        raise ValueError(f"Unknown STT backend: {settings.stt_backend}")
+
+    logger.info(f"Creating local Whisper STT: model={model}")
 
     whisper_stt = FasterWhisperSTT(
-        model=settings.whisper_model,
+        model=model,
         device=settings.whisper_device,
         compute_type=settings.whisper_compute_type,
         language=settings.whisper_language,
         download_root=settings.model_cache_dir,
+        cpu_threads=settings.whisper_cpu_threads,
+        num_workers=settings.whisper_num_workers,
+        beam_size=settings.whisper_beam_size,
     )
 
     return whisper_stt
 
 
+@functools.lru_cache(maxsize=4)
+def _load_vad(
+    activation_threshold: float,
+    min_speech_duration: float,
+    min_silence_duration: float,
+):
+    """
+    Load a Silero VAD, shared by every caller asking for the same settings.
+
+    A VAD instance only holds the ONNX session; each consumer opens its own
+    stream, so one model can serve every session in the process. Callers
+    must not update_options() on it - that would retune every session.
+    """
+    return silero.VAD.load(
+        min_speech_duration=min_speech_duration,
+        min_silence_duration=min_silence_duration,
+        activation_threshold=activation_threshold,
+    )
+
+
 def create_vad(vad_settings: dict | None = None):
     """Create Silero VAD for voice activity detection.
 
@@ -46,22 +90,34 @@ def create_vad(vad_settings: dict | None = None):
     logger.info(f"Creating Silero VAD: threshold={activation_threshold}, "
                 f"min_speech={min_speech_duration}s, min_silence={min_silence_duration}s")
 
-    vad = silero.VAD.load(
-        min_speech_duration=min_speech_duration,
-        min_silence_duration=min_silence_duration,
-        activation_threshold=activation_threshold,
+    return _load_vad(
+        float(activation_threshold),
+        float(min_speech_duration),
+        float(min_silence_duration),
     )
 
-    return vad
-
 
 def create_streaming_stt(stt, vad):
     """
-    Wrap non-streaming STT with StreamAdapter for real-time use.
+    Wrap non-streaming STT for real-time use.
 
-    The StreamAdapter uses VAD to detect speech boundaries and sends
-    complete speech segments to Whisper for transcription.
+    By default the StreamAdapter is used, which sends complete speech segments
+    to Whisper for transcription. With stt_chunk_seconds > 0 ChunkedWhisperSTT
+    transcribes rolling windows while the user is still speaking, so only the
+    last window is decoded after VAD detects end of speech.
     """
+    if settings.stt_chunk_seconds > 0:
+        logger.info(
+            f"Creating ChunkedWhisperSTT: chunk={settings.stt_chunk_seconds}s, "
+            f"overlap={settings.stt_chunk_overlap_seconds}s"
+        )
+        return ChunkedWhisperSTT(
+            stt=stt,
+            vad=vad,
+            chunk_seconds=settings.stt_chunk_seconds,
+            overlap_seconds=settings.stt_chunk_overlap_seconds,
+        )
+
     logger.info("Creating StreamAdapter for non-streaming STT")
 
     return StreamAdapter(
@@ -82,16 +138,57 @@ def create_tts():
             base_url=base_url,
         )
 
+        # The plugin streams the HTTP response body as it arrives, and the
+        # agent session feeds it sentence by sentence, so first audio only
+        # waits on the first sentence rather than the whole reply
         return openai_plugin.TTS(
             model="kokoro",
             voice=settings.kokoro_voice,
             speed=settings.kokoro_speed,
             client=client,
+            response_format=settings.kokoro_response_format,
         )
     else:
         raise ValueError(f"Unknown TTS provider: {settings.tts_provider}")
 
 
+async def warm_tts(tts) -> None:
+    """Synthesize one short word so the TTS server loads its model before the first reply."""
+    try:
+        stream = tts.synthesize("Hello.")
+        try:
+            async for _ in stream:
+                pass
+        finally:
+            await stream.aclose()
+        logger.info("TTS warmed up")
+    except Exception as e:
+        logger.warning(f"Failed to warm up TTS: {e}")
+
+
+async def warm_llm() -> None:
+    """
+    Load the Ollama model ahead of the first user turn.
+
+    An empty-prompt generate loads the weights without producing tokens, so
+    the first real request skips the model load. No keep_alive or runner
+    options are sent: chat requests go through the OpenAI-compatible API,
+    which can't pass them, so the model is loaded exactly as those requests
+    will use it (server defaults / Modelfile) and isn't reloaded on turn one.
+    """
+    if settings.llm_provider != "ollama":
+        return
+
+    try:
+        from .ollama_client import get_ollama_client
+
+        client = get_ollama_client(settings.ollama_host)
+        await client.generate(model=settings.ollama_model, prompt="")
+        logger.info(f"Ollama model warmed up: {settings.ollama_model}")
+    except Exception as e:
+        logger.warning(f"Failed to warm up Ollama model: {e}")
+
+
 def create_llm():
     """Create LLM instance - Ollama via OpenAI-compatible API."""
     import httpx
@@ -100,11 +197,19 @@ def create_llm():
         base_url = settings.ollama_host.rstrip('/') + '/v1'
         logger.info(f"Creating Ollama LLM via OpenAI plugin: {settings.ollama_model} at {base_url}")
 
+        # Ollama's /v1 endpoint ignores keep_alive and runner options (num_ctx,
+        # ...); those are set on the Ollama server (OLLAMA_KEEP_ALIVE,
+        # OLLAMA_CONTEXT_LENGTH) or in the Modelfile. max_tokens maps to num_predict.
+        llm_kwargs = {}
+        if settings.ollama_num_predict:
+            llm_kwargs["extra_body"] = {"max_tokens": settings.ollama_num_predict}
+
         return openai_plugin.LLM(
             model=settings.ollama_model,
             base_url=base_url,
             api_key="ollama",
             timeout=httpx.Timeout(None),  # No timeout - wait indefinitely
+            **llm_kwargs,
         )
     elif settings.llm_provider == "anthropic":
         if not settings.anthropic_api_key:
@@ -129,4 +234,5 @@ def create_wake_word_detector():
         model_names=[settings.wake_word_model],
         threshold=settings.wake_word_threshold,
         cooldown_seconds=settings.wake_word_cooldown,
+        int8_dir=settings.model_cache_dir if settings.wake_word_int8 else None,
     )
@@ -11,16 +11,26 @@ openWakeWord runs locally with pre-trained models and supports:
 
 import logging
 import asyncio
+import os
+import queue
+import threading
+import time
 import numpy as np
 from typing import Callable, Optional, Awaitable
 from pathlib import Path
 
+from .quantize import quantize_onnx_once
+
 logger = logging.getLogger("alexa-os.wakeword")
 
 # Model constants
 SAMPLE_RATE = 16000  # 16kHz audio required
 FRAME_SIZE = 1280  # 80ms at 16kHz (optimal for openWakeWord)
 DEFAULT_THRESHOLD = 0.5  # Detection confidence threshold
+FRAME_BYTES = FRAME_SIZE * 2  # 2 bytes per int16 sample
+MAX_BATCH_FRAMES = 4  # Frames scored per predict() call when a backlog builds up
+FRAME_QUEUE_SIZE = 4  # Batches waiting for the inference thread; the oldest is dropped when full
+COMPACT_BYTES = 64 * 1024  # Consumed audio dropped from the buffer in one go past this
 
 
 class WakeWordDetector:
@@ -38,7 +48,7 @@ class WakeWordDetector:
         )
         await detector.start()
 
-        # Feed audio frames
+        # Feed audio frames (non-blocking; inference runs on a worker thread)
         detector.process_audio(audio_frame)
 
         # Stop when done
@@ -52,6 +62,7 @@ class WakeWordDetector:
         threshold: float = DEFAULT_THRESHOLD,
         model_path: Optional[str] = None,
         cooldown_seconds: float = 2.0,
+        int8_dir: Optional[str] = None,
     ):
         """
         Initialize the wake word detector.
@@ -64,17 +75,33 @@ class WakeWordDetector:
             threshold: Detection confidence threshold (0.0 to 1.0).
             model_path: Optional custom model path directory.
             cooldown_seconds: Minimum seconds between detections.
+            int8_dir: If set, run INT8-quantized copies of the embedding and
+                     wake word models, built into this directory on first use.
         """
         self._model_names = model_names or ["hey_jarvis_v0.1"]
         self._on_wake_word = on_wake_word
         self._threshold = threshold
         self._model_path = model_path
         self._cooldown_seconds = cooldown_seconds
+        self._int8_dir = int8_dir
 
         self._model = None
         self._running = False
-        self._last_detection_time = 0.0
+        self._last_detection_time = float("-inf")  # time.monotonic() of last detection
         self._audio_buffer = bytearray()
+        # Start of the unconsumed audio in _audio_buffer
+        self._read_idx = 0
+        # Reusable float32/int16 buffers for converting float input
+        self._f32_scratch = np.empty(FRAME_SIZE, dtype=np.float32)
+        self._i16_scratch = np.empty(FRAME_SIZE, dtype=np.int16)
+
+        # predict() runs on a worker thread fed by a bounded queue of frame batches;
+        # detections are handed back to the event loop the detector was started on
+        self._frame_queue: queue.Queue[Optional[np.ndarray]] = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+        self._worker: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Serializes predict() on the worker with reset() from the event loop
+        self._model_lock = threading.Lock()
 
         logger.info(
             f"WakeWordDetector initialized: models={self._model_names}, "
@@ -96,14 +123,26 @@ class WakeWordDetector:
             logger.info("Checking/downloading openWakeWord models...")
             openwakeword.utils.download_models()
 
-            # Load the model
-            logger.info(f"Loading wake word models: {self._model_names}")
+            wakeword_models = self._model_names
+            model_kwargs = {}
+            if self._int8_dir:
+                wakeword_models, model_kwargs = self._int8_models(openwakeword)
+
+            # Load the model. openWakeWord pins every ONNX session to the CPU
+            # execution provider with one thread, which suits 80ms frames.
+            logger.info(f"Loading wake word models: {wakeword_models}")
             self._model = Model(
-                wakeword_models=self._model_names,
+                wakeword_models=wakeword_models,
                 inference_framework="onnx",  # Use ONNX for cross-platform
+                **model_kwargs,
             )
 
+            self._loop = asyncio.get_running_loop()
             self._running = True
+            self._worker = threading.Thread(
+                target=self._worker_loop, name="wake-word", daemon=True
+            )
+            self._worker.start()
             logger.info("WakeWordDetector started successfully")
 
         except ImportError as e:
@@ -114,84 +153,158 @@ class WakeWordDetector:
             logger.error(f"Failed to load wake word model: {e}")
             raise
 
+    def _int8_models(self, openwakeword) -> tuple[list[str], dict]:
+        """
+        Resolve INT8 copies of the configured wake word models and the shared
+        embedding model, falling back to the float model for any that fail.
+
+        The melspectrogram model is left in float: it is a fixed STFT front
+        end with no weights worth quantizing.
+        """
+        target_dir = Path(self._int8_dir) / "openwakeword_int8"
+        pretrained = [Path(p) for p in openwakeword.get_pretrained_model_paths("onnx")]
+
+        wakeword_models = []
+        for name in self._model_names:
+            if os.path.exists(name):
+                source = Path(name)
+            else:
+                matches = [p for p in pretrained if name.replace(" ", "_") in p.name]
+                source = matches[0] if matches else None
+            quantized = quantize_onnx_once(source, target_dir / source.name) if source else None
+            wakeword_models.append(quantized or name)
+
+        model_kwargs = {}
+        embedding_source = Path(openwakeword.__file__).parent / "resources" / "models" / "embedding_model.onnx"
+        embedding = quantize_onnx_once(embedding_source, target_dir / embedding_source.name)
+        if embedding:
+            model_kwargs["embedding_model_path"] = embedding
+        return wakeword_models, model_kwargs
+
     async def stop(self) -> None:
         """Stop detection and clean up resources."""
         self._running = False
+        if self._worker is not None:
+            self._enqueue(None)
+            await asyncio.to_thread(self._worker.join)
+            self._worker = None
         self._model = None
         self._audio_buffer.clear()
+        self._read_idx = 0
         logger.info("WakeWordDetector stopped")
 
-    def process_audio(self, audio_data: bytes | np.ndarray) -> Optional[tuple[str, float]]:
+    def process_audio(self, audio_data: bytes | np.ndarray) -> None:
         """
         Process an audio frame for wake word detection.
 
         Audio should be 16-bit PCM at 16kHz sample rate.
         Frames are buffered internally to process in 80ms chunks.
 
+        Never blocks on inference: complete frames are queued for the worker
+        thread, and detections are reported through the on_wake_word callback.
+
         Args:
             audio_data: Audio bytes or numpy array (int16 or float32)
-
-        Returns:
-            Tuple of (model_name, confidence) if wake word detected,
-            None otherwise.
         """
         if not self._running or self._model is None:
-            return None
+            return
 
-        # Convert to bytes if numpy array
+        # int16 arrays are appended as-is; float32 [-1.0, 1.0] is converted to int16
         if isinstance(audio_data, np.ndarray):
             if audio_data.dtype == np.float32:
-                # Convert float32 [-1.0, 1.0] to int16
-                audio_data = (audio_data * 32767).astype(np.int16)
-            audio_data = audio_data.tobytes()
-
-        # Buffer audio
-        self._audio_buffer.extend(audio_data)
+                audio_data = self._float_to_int16(audio_data)
+            audio_data = np.ascontiguousarray(audio_data)
 
-        # Process when we have enough data (80ms frame = 1280 samples = 2560 bytes)
-        frame_bytes = FRAME_SIZE * 2  # 2 bytes per int16 sample
+        # Frames are read in place by advancing _read_idx; consumed bytes are
+        # dropped here, before the buffer grows and while no frame views it
+        buffer = self._audio_buffer
+        if self._read_idx and (self._read_idx == len(buffer) or self._read_idx >= COMPACT_BYTES):
+            del buffer[:self._read_idx]
+            self._read_idx = 0
 
-        detection_result = None
-
-        while len(self._audio_buffer) >= frame_bytes:
-            # Extract frame
-            frame = bytes(self._audio_buffer[:frame_bytes])
-            self._audio_buffer = self._audio_buffer[frame_bytes:]
-
-            # Convert to numpy for openWakeWord
-            audio_array = np.frombuffer(frame, dtype=np.int16)
-
-            # Run prediction
-            predictions = self._model.predict(audio_array)
-
-            # Check each model's prediction
-            import time
-            current_time = time.time()
-
-            for model_name, confidence in predictions.items():
-                if confidence >= self._threshold:
-                    # Check cooldown
-                    if current_time - self._last_detection_time >= self._cooldown_seconds:
-                        self._last_detection_time = current_time
-                        logger.info(
-                            f"Wake word detected: {model_name} "
-                            f"(confidence: {confidence:.2f})"
+        # Buffer audio
+        buffer.extend(audio_data)
+
+        # Queue when we have enough data (80ms frame = 1280 samples = 2560 bytes).
+        # A backlog of frames goes to predict() in one call: openWakeWord computes
+        # the melspectrogram once, scores every frame and returns the max.
+        while (pending := len(buffer) - self._read_idx) >= FRAME_BYTES:
+            frames = min(pending // FRAME_BYTES, MAX_BATCH_FRAMES)
+            # Copied out as int16: the worker reads it after the buffer has moved on
+            audio_array = np.frombuffer(
+                buffer, dtype=np.int16, count=frames * FRAME_SIZE, offset=self._read_idx
+            ).copy()
+            self._read_idx += frames * FRAME_BYTES
+            self._enqueue(audio_array)
+
+    def _enqueue(self, item: Optional[np.ndarray]) -> None:
+        """Queue a frame batch (or the stop sentinel), dropping the oldest batch if full."""
+        try:
+            self._frame_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self._frame_queue.get_nowait()
+                logger.debug("Wake word inference behind, dropped oldest frames")
+            except queue.Empty:
+                pass
+            self._frame_queue.put_nowait(item)
+
+    def _worker_loop(self) -> None:
+        """Run predict() on queued frame batches until the stop sentinel arrives."""
+        while (audio_array := self._frame_queue.get()) is not None:
+            with self._model_lock:
+                if self._model is None:
+                    continue
+                predictions = self._model.predict(audio_array)
+            self._check_predictions(predictions)
+
+    def _check_predictions(self, predictions: dict) -> None:
+        """Report predictions over threshold and outside the cooldown to the event loop."""
+        # One clock read per batch; its frames are only 80ms apart
+        current_time = time.monotonic()
+
+        # Check each model's prediction
+        for model_name, confidence in predictions.items():
+            if confidence >= self._threshold:
+                # Check cooldown
+                if current_time - self._last_detection_time >= self._cooldown_seconds:
+                    self._last_detection_time = current_time
+                    logger.info(
+                        f"Wake word detected: {model_name} "
+                        f"(confidence: {confidence:.2f})"
+                    )
+
+                    # Trigger callback on the event loop
+                    if self._on_wake_word:
+                        asyncio.run_coroutine_threadsafe(
+                            self._on_wake_word(model_name, float(confidence)), self._loop
                         )
-                        detection_result = (model_name, confidence)
-
-                        # Trigger callback asynchronously
-                        if self._on_wake_word:
-                            asyncio.create_task(
-                                self._on_wake_word(model_name, confidence)
-                            )
 
-        return detection_result
+    def _float_to_int16(self, audio_data: np.ndarray) -> np.ndarray:
+        """Scale and round float32 samples to int16 in the scratch buffers."""
+        n = audio_data.size
+        if self._f32_scratch.size < n:
+            self._f32_scratch = np.empty(n, dtype=np.float32)
+            self._i16_scratch = np.empty(n, dtype=np.int16)
+        scaled = np.multiply(audio_data.ravel(), 32767.0, out=self._f32_scratch[:n])
+        np.rint(scaled, out=scaled)
+        out = self._i16_scratch[:n]
+        np.copyto(out, scaled, casting="unsafe")
+        return out
 
     def reset(self) -> None:
         """Reset the detector state (clear buffers, reset model state)."""
         self._audio_buffer.clear()
-        if self._model is not None:
-            self._model.reset()
+        self._read_idx = 0
+        # Drop queued frames; waits out a predict() already in progress
+        while True:
+            try:
+                self._frame_queue.get_nowait()
+            except queue.Empty:
+                break
+        with self._model_lock:
+            if self._model is not None:
+                self._model.reset()
         logger.debug("WakeWordDetector reset")
 
     @property
@@ -299,16 +412,18 @@ class WakeWordGatedSession:
             await self._on_activate()
 
     async def _monitor_timeout(self) -> None:
-        """Monitor for session timeout."""
-        import time
+        """
+        Monitor for session timeout.
 
+        Sleeps until the current deadline rather than polling; if activity was
+        refreshed meanwhile, it sleeps again until the pushed-back deadline.
+        """
         while self._is_active:
-            await asyncio.sleep(1.0)
-
-            elapsed = time.time() - self._last_activity_time
-            if elapsed >= self._timeout_seconds:
+            remaining = self._last_activity_time + self._timeout_seconds - time.monotonic()
+            if remaining <= 0:
                 await self._deactivate()
                 break
+            await asyncio.sleep(remaining)
 
     async def _deactivate(self) -> None:
         """Deactivate the session and return to listening mode."""
@@ -327,8 +442,7 @@ class WakeWordGatedSession:
 
     def refresh_activity(self) -> None:
         """Refresh the activity timer (call on user/agent speech)."""
-        import time
-        self._last_activity_time = time.time()
+        self._last_activity_time = time.monotonic()
 
     @property
     def is_active(self) -> bool: